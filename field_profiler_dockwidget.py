@@ -3,23 +3,29 @@
 import os
 import csv
 import re
+import array
+import heapq
+import hashlib
 import string
+from functools import partial
+from itertools import islice, repeat
+from operator import countOf, methodcaller, floordiv, sub
 from qgis.PyQt import QtWidgets, QtCore, QtGui
-from qgis.PyQt.QtCore import QVariant, Qt, QDate, QDateTime, QTime
+from qgis.PyQt.QtCore import (QVariant, Qt, QDate, QDateTime, QTime, QByteArray, QObject, QRunnable,
+                              QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex)
 from qgis.PyQt.QtWidgets import (QWidget, QVBoxLayout, QGroupBox, QLabel, QCheckBox,
-                                 QListWidget, QPushButton, QDockWidget, QTableWidget,
-                                 QAbstractItemView, QTableWidgetItem, QApplication,
+                                 QListWidget, QPushButton, QDockWidget, QTableView,
+                                 QAbstractItemView, QApplication,
                                  QFileDialog, QHBoxLayout, QSizePolicy, QProgressBar,
-                                 QSpinBox, QFormLayout)
+                                 QSpinBox, QFormLayout, QHeaderView)
 from qgis.gui import QgsMapLayerComboBox
 from qgis.core import (QgsProject, QgsVectorLayer, QgsField, Qgis,
                        QgsStatisticalSummary, QgsMapLayerProxyModel, QgsFeatureRequest,
-                       QgsExpression)
+                       QgsExpression, QgsApplication, QgsTask, QgsVectorLayerFeatureSource)
 
-import statistics
-from collections import Counter, OrderedDict
+from collections import Counter
 import numpy # Keep this import
-from datetime import datetime # Added for analyze_date_field_enhanced
+from datetime import datetime, timedelta # Added for analyze_date_field_enhanced
 
 
 SCIPY_AVAILABLE = False
@@ -35,6 +41,264 @@ STOP_WORDS = set([
     'will', 'with',
 ])
 
+# Attribute value types that can carry a null (NULL is a QVariant); native Python values never do.
+NULLABLE_VALUE_TYPES = (QVariant, QDate, QDateTime, QTime, QByteArray)
+# Tab, newline and carriage return are tolerated in text values; this table deletes them before isprintable().
+ALLOWED_CONTROL_CHARS_DELETE = str.maketrans('', '', '\t\n\r')
+# Punctuation stripped before splitting text into words for 'Top Words' (hyphens are kept).
+WORD_CLEAN_RE = re.compile(r'[^\w\s-]')
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# More robust URL pattern allowing various TLDs and paths
+URL_RE = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w._/?#%&@!=कोंडीत]*)*')
+# Characters replaced by '_' when a layer name becomes the default CSV export file name
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\.-]')
+
+# Shapiro-Wilk p-values are unreliable beyond ~5000 values (scipy warns), so larger inputs are subsampled.
+SHAPIRO_MAX_SAMPLE = 5000
+SHAPIRO_SAMPLE_SEED = 0
+# Naive datetimes are turned into datetime64[us] numbers as (value - epoch) // 1 microsecond.
+DATETIME64_EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class AnalysisWorkerSignals(QObject):
+    """Signals for AnalysisWorker (QRunnable is not a QObject and cannot own signals)."""
+    analysisReady = pyqtSignal(int, str, object) # run generation, field name, results dict
+
+
+class AnalysisWorker(QRunnable):
+    """Runs the statistics for one field on a QThreadPool thread.
+
+    analyze_fn must not touch widgets; its result is delivered back to the GUI
+    thread through signals.analysisReady.
+    """
+    def __init__(self, generation, field_name, analyze_fn):
+        super().__init__()
+        self.generation = generation
+        self.field_name = field_name
+        self.analyze_fn = analyze_fn
+        self.signals = AnalysisWorkerSignals()
+
+    def run(self):
+        try:
+            results = self.analyze_fn()
+        except Exception as e_worker:
+            results = {'Error': f'Analysis function error: {e_worker}'}
+        self.signals.analysisReady.emit(self.generation, self.field_name, results)
+
+
+class FeatureCollectionTask(QgsTask):
+    """Iterates the features to analyze on a QgsTaskManager thread and fills the per-field collectors.
+
+    Reads from a QgsVectorLayerFeatureSource created on the GUI thread, so the
+    layer itself is not accessed here. Numeric columns are converted to float64
+    arrays before the task completes; on failure the exception is kept in
+    self.exception for the GUI thread to report.
+    """
+    def __init__(self, description, feature_source, request, field_jobs, feature_count, non_printable_check=None):
+        super().__init__(description, QgsTask.CanCancel)
+        self.feature_source = feature_source
+        self.request = request
+        self.field_jobs = field_jobs # (field index, is numeric, is string, collector) per field
+        self.feature_count = feature_count
+        self.non_printable_check = non_printable_check # None when the option is off
+        self.exception = None
+
+    def run(self):
+        try:
+            self._collect()
+        except Exception as e_iter:
+            self.exception = e_iter
+            return False
+        return not self.isCanceled()
+
+    def _collect(self):
+        # The field type dispatch is resolved here once: each type gets its own tight loop over
+        # (attribute index, bound append methods) without per-value type checks.
+        numeric_jobs, string_jobs, other_jobs = [], [], []
+        for field_index, is_numeric, is_string, collector in self.field_jobs:
+            if is_numeric:
+                numeric_jobs.append((field_index, collector['raw_values'].append, collector['value_fids'].append))
+            elif is_string:
+                string_jobs.append((field_index, collector['raw_values'].append, collector['non_printable_fids'].append))
+            else:
+                other_jobs.append((field_index, collector['raw_values'].append))
+        has_non_printable_chars = self.non_printable_check
+        nullable_types = NULLABLE_VALUE_TYPES
+        reports_progress = self.feature_count > 0 # featureCount() is -1 when the provider does not know it
+        progress_step = max(1, self.feature_count // 100) # About one progress update per percent
+        iteration_count = 0
+        for feature in self.feature_source.getFeatures(self.request):
+            iteration_count += 1
+            fid = feature.id()
+            attrs = feature.attributes() # One call per feature instead of one accessor call per field
+            # Nulls are skipped here and counted afterwards as features minus collected values.
+            # isinstance against a few Qt types is much cheaper than a failing hasattr() on str/int/float.
+            for field_index, append_value, append_fid in numeric_jobs:
+                val = attrs[field_index]
+                if val is None or (isinstance(val, nullable_types) and val.isNull()): continue
+                append_value(val); append_fid(fid) # Converted to float in bulk after the loop
+            for field_index, append_value, append_non_printable_fid in string_jobs:
+                val = attrs[field_index]
+                if val is None or (isinstance(val, nullable_types) and val.isNull()): continue
+                append_value(val)
+                if has_non_printable_chars is not None and has_non_printable_chars(str(val)):
+                    append_non_printable_fid(fid)
+            for field_index, append_value in other_jobs:
+                val = attrs[field_index]
+                if val is None or (isinstance(val, nullable_types) and val.isNull()): continue
+                append_value(val)
+
+            if iteration_count % progress_step == 0:
+                if self.isCanceled(): return
+                if reports_progress: self.setProgress(min(100.0, iteration_count * 100.0 / self.feature_count))
+
+        for field_index, is_numeric, is_string, collector in self.field_jobs:
+            collector['non_null_count'] = len(collector['raw_values'])
+            collector['null_count'] = iteration_count - collector['non_null_count']
+            if is_numeric:
+                collector['float_values'], collector['conversion_error_feature_ids'] = self._to_float_array(collector['raw_values'], collector['value_fids'])
+                collector['conversion_errors'] = len(collector['conversion_error_feature_ids'])
+                collector['raw_values'] = collector['value_fids'] = None # Only the float64 array is analyzed; free the Python objects now
+
+    @staticmethod
+    def _to_float_array(raw_values, value_fids):
+        # One C-level conversion of the whole column; only if some value cannot be converted
+        # fall back to a per-value pass that records the ids of the offending features.
+        try:
+            return numpy.array(raw_values, dtype=numpy.float64), []
+        except (ValueError, TypeError):
+            pass
+        float_values = array.array('d'); error_fids = []
+        for val, fid in zip(raw_values, value_fids):
+            try:
+                float_values.append(float(val))
+            except (ValueError, TypeError):
+                error_fids.append(fid)
+        return numpy.frombuffer(float_values, dtype=numpy.float64), error_fids
+
+
+class ResultsModel(QAbstractTableModel):
+    """Read-only model behind the results table: one row per statistic, one column per field.
+
+    Column 0 holds the translated statistic name (original English key under Qt.UserRole).
+    Cell values are kept as analyzed and formatted in data() the first time the view asks
+    for them; alignment, tooltips and colors are answered there too, so only cells that are
+    actually painted are formatted and styled.
+    """
+    UNAVAILABLE_TEXTS = frozenset(["N/A (Scipy not found)", "N/A (>=3 values needed)", "N/A (<3 valid)"])
+    UNAVAILABLE_BRUSH = QtGui.QBrush(Qt.gray)
+    ALIGN_RIGHT = int(Qt.AlignVCenter | Qt.AlignRight)
+    ALIGN_LEFT = int(Qt.AlignVCenter | Qt.AlignLeft)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._field_names = []
+        self._results_data = {}
+        # (stat key, statistic name, stat tooltip, stat background brush, align right by key) per row
+        self._rows = []
+        self._unsorted_rows = []
+        self._display_texts = {} # (stat key, column) -> formatted cell text, filled on first request
+        self._float_fmt = '%.2f'
+
+    def set_results(self, headers, field_names, results_data, rows, decimal_places=2):
+        self.beginResetModel()
+        self._headers = headers
+        self._field_names = field_names
+        self._results_data = results_data
+        self._rows = list(rows)
+        self._unsorted_rows = rows
+        self._display_texts = {}
+        self._float_fmt = f'%.{decimal_places}f'
+        self.endResetModel()
+
+    def clear(self):
+        self.set_results([], [], {}, [])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole: return None
+        if orientation == Qt.Vertical: return section + 1
+        return self._headers[section] if 0 <= section < len(self._headers) else None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self._display_text(row, column)
+        stat_key, _, stat_tooltip, stat_background, key_align_right = row
+        if column == 0:
+            if role == Qt.UserRole: return stat_key
+            if role == Qt.ToolTipRole: return stat_tooltip
+            if role == Qt.BackgroundRole: return stat_background
+            return None
+
+        value = self._value(stat_key, column)
+        if role == Qt.TextAlignmentRole:
+            align_right = key_align_right or isinstance(value, (int, float, bool, numpy.number))
+            return self.ALIGN_RIGHT if align_right else self.ALIGN_LEFT
+        is_long_text = isinstance(value, str) and ('\n' in value or len(value) > 60)
+        if role == Qt.ToolTipRole:
+            return value if is_long_text else None # Show full value in tooltip if long or multiline
+        if role == Qt.ForegroundRole:
+            if not is_long_text and self._display_text(row, column) in self.UNAVAILABLE_TEXTS:
+                return self.UNAVAILABLE_BRUSH # Grey out unavailable stats
+        return None
+
+    def _value(self, stat_key, column):
+        return self._results_data.get(self._field_names[column - 1], {}).get(stat_key, "")
+
+    def _display_text(self, row, column):
+        if column == 0: return row[1]
+        cache_key = (row[0], column)
+        text = self._display_texts.get(cache_key)
+        if text is None:
+            text = self._display_texts[cache_key] = self._format_value(row[0], self._value(row[0], column))
+        return text
+
+    def _format_value(self, stat_key, value):
+        if isinstance(value, bool):
+            return str(value)
+        if isinstance(value, float):
+            if numpy.isnan(value): return "N/A"
+            return ('%.4g' if stat_key == 'Normality (Shapiro-Wilk p)' else self._float_fmt) % value
+        if isinstance(value, list):
+            if stat_key != 'Mode(s)':
+                return "; ".join(map(str, value))
+            # Format numbers in mode list with specified decimal places
+            float_fmt = self._float_fmt
+            return ", ".join(float_fmt % v_mode if isinstance(v_mode, (int, float)) else str(v_mode) for v_mode in value)
+        return str(value)
+
+    def text_grid(self):
+        # Header row plus display rows in the current (possibly sorted) order, newlines flattened for copy/export
+        grid = [list(self._headers)]
+        for row in self._rows:
+            grid.append([self._display_text(row, column).replace("\n", " | ") for column in range(len(self._headers))])
+        return grid
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Rows are compared by their display text; column -1 restores the statistics order.
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._rows
+        if 0 <= column < len(self._headers):
+            self._rows = sorted(old_rows, key=lambda row: self._display_text(row, column), reverse=(order == Qt.DescendingOrder))
+        else:
+            self._rows = list(self._unsorted_rows)
+        new_row_by_id = {id(row): r for r, row in enumerate(self._rows)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [
+            self.index(new_row_by_id[id(old_rows[idx.row()])], idx.column()) for idx in old_indexes])
+        self.layoutChanged.emit()
+
+
 class FieldProfilerDockWidget(QDockWidget):
     STAT_KEYS_NUMERIC = [
         'Non-Null Count', 'Null Count', '% Null', 'Conversion Errors',
@@ -67,6 +331,21 @@ class FieldProfilerDockWidget(QDockWidget):
     ]
     STAT_KEYS_OTHER = [ 'Non-Null Count', 'Null Count', '% Null', 'Status', 'Data Type Mismatch Hint']
     STAT_KEYS_ERROR = ['Error', 'Status']
+    # All predefined STAT_KEYS lists combined into a single ordered list without duplicates
+    PREDEFINED_STAT_ORDER = list(dict.fromkeys(STAT_KEYS_NUMERIC + STAT_KEYS_TEXT + STAT_KEYS_DATE +
+                                               STAT_KEYS_OTHER + STAT_KEYS_ERROR))
+    QUALITY_KEYWORDS = ['%', 'Null', 'Empty', 'Error', 'Outlier', 'Spaces', 'Variance', 'Flag', 'Conversion', 'Mismatch', 'Non-Printable']
+    QUALITY_KEYWORDS_LOWER = [keyword.lower() for keyword in QUALITY_KEYWORDS]
+    STAT_NAME_COLUMN_WIDTH = 180
+    FIELD_COLUMN_WIDTH = 120
+    COLUMN_WIDTH_SAMPLE_ROWS = 16 # Field column widths are measured on the header and this many non-empty cells only
+    COLUMN_WIDTH_PADDING = 24 # Cell margins plus room for the sort indicator
+    FIELD_RESULTS_CACHE_SIZE = 256 # Max. number of per-field results kept for re-runs with unchanged inputs
+    # Statistic name backgrounds, shared by every row instead of one brush per row
+    QUALITY_ROW_BRUSH = QtGui.QBrush(QtGui.QColor(255, 240, 240)) # Light red
+    DISTRIBUTION_ROW_BRUSH = QtGui.QBrush(QtGui.QColor(240, 240, 255)) # Light blue
+    DEFAULT_ROW_BRUSH = QtGui.QBrush(QtGui.QColor(230, 230, 230)) # Light grey
+    ALIGN_RIGHT_KEYWORDS = ['Count', 'Error', 'Outlier', 'Zero', 'Positive', 'Negative', 'Space', 'Empty', 'Value', 'Length', 'Pctl', 'Optimal Bins']
 
 
     def __init__(self, iface, parent=None):
@@ -79,20 +358,34 @@ class FieldProfilerDockWidget(QDockWidget):
         self.main_layout = QVBoxLayout(self.main_widget)
         self.setWidget(self.main_widget)
 
-        self.analysis_results_cache = OrderedDict()
+        self.analysis_results_cache = {}
         self.conversion_error_feature_ids_by_field = {}
         self.non_printable_char_feature_ids_by_field = {}
         self._was_analyzing_selected_features = False
+        self._analysis_generation = 0 # Bumped on every run/reset so late worker results can be discarded
+        self._pending_fields = set()
+        self._active_workers = []
+        self._collection_task = None # FeatureCollectionTask of the current run while it reads features
+        self._header_field_names = []
+        # (layer id, field, analyzed fids, options, decimals, unique limit) -> (field results, conversion error fids, non-printable fids)
+        self._field_results_cache = {}
+        self._pending_cache_keys = {} # field name -> cache key of the running analysis
+        self._cache_layer = None # Layer whose edits invalidate _field_results_cache
 
         self._define_stat_tooltips()
+        self._define_calendar_names()
+        self._empty_numeric_results = self._build_empty_numeric_results()
+        self._stat_key_styles = {} # stat key -> (is_quality_issue, is_distribution_stat, align_right)
+        self._attr_table_cache = {} # layer id -> attribute table widget last found for it
         self._create_input_group()
         self._create_results_ui()
 
         self.layerComboBox.layerChanged.connect(self.populate_fields)
         self.analyzeButton.clicked.connect(self.run_analysis)
+        self.fitColumnsButton.clicked.connect(self.resultsTableView.resizeColumnsToContents)
         self.copyButton.clicked.connect(self.copy_results_to_clipboard)
         self.exportButton.clicked.connect(self.export_results_to_csv)
-        self.resultsTableWidget.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self.resultsTableView.doubleClicked.connect(self._on_cell_double_clicked)
 
         self.populate_fields(self.layerComboBox.currentLayer())
         if not SCIPY_AVAILABLE:
@@ -138,7 +431,7 @@ class FieldProfilerDockWidget(QDockWidget):
             '% Integer Values': self.tr("Percentage of non-null numeric values that are whole numbers."),
             'Skewness': self.tr("Measure of asymmetry. Positive: tail on right. Negative: tail on left. Requires Scipy."),
             'Kurtosis': self.tr("Measure of tailedness (Fisher's, normal=0). Positive: heavy tails. Negative: light tails. Requires Scipy."),
-            'Normality (Shapiro-Wilk p)': self.tr("P-value from Shapiro-Wilk test for normality. Low p (<0.05) suggests non-normal. Requires Scipy & >=3 values."),
+            'Normality (Shapiro-Wilk p)': self.tr("P-value from Shapiro-Wilk test for normality. Low p (<0.05) suggests non-normal. Requires Scipy & >=3 values. Fields with more than 5000 values are tested on a reproducible random sample of 5000."),
             'Normality (Likely Normal)': self.tr("True if Shapiro-Wilk p-value > 0.05. Requires Scipy."),
             '1st Pctl': self.tr("1st Percentile."), '5th Pctl': self.tr("5th Percentile."),
             '95th Pctl': self.tr("95th Percentile."), '99th Pctl': self.tr("99th Percentile."),
@@ -179,6 +472,13 @@ class FieldProfilerDockWidget(QDockWidget):
             'Data Type Mismatch Hint': self.tr("A suggestion if the field's content statistically resembles a different data type.")
         }
 
+    def _define_calendar_names(self):
+        # Translated once per instance rather than on every date field analysis
+        self.day_names = (self.tr("Mon"), self.tr("Tue"), self.tr("Wed"), self.tr("Thu"), self.tr("Fri"), self.tr("Sat"), self.tr("Sun"))
+        self.month_names = ("", self.tr("Jan"), self.tr("Feb"), self.tr("Mar"), self.tr("Apr"), 
+                            self.tr("May"), self.tr("Jun"), self.tr("Jul"), self.tr("Aug"), 
+                            self.tr("Sep"), self.tr("Oct"), self.tr("Nov"), self.tr("Dec"))
+
     def _create_input_group(self):
         self.input_group_box = QGroupBox(self.tr("Input & Settings"))
         main_input_layout = QVBoxLayout()
@@ -261,15 +561,24 @@ class FieldProfilerDockWidget(QDockWidget):
     def _create_results_ui(self):
         self.results_group_box = QGroupBox(self.tr("Analysis Results"))
         results_layout = QVBoxLayout()
-        self.resultsTableWidget = QTableWidget()
-        self.resultsTableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.resultsTableWidget.setAlternatingRowColors(True)
-        self.resultsTableWidget.setSortingEnabled(True) 
-        results_layout.addWidget(self.resultsTableWidget)
+        self.resultsModel = ResultsModel(self)
+        self.resultsTableView = QTableView()
+        self.resultsTableView.setModel(self.resultsModel)
+        self.resultsTableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.resultsTableView.setAlternatingRowColors(True)
+        self.resultsTableView.setSortingEnabled(True) 
+        # Fixed default sizes (field columns are then sized from a sample of rows); measuring every cell is left to "Fit Columns".
+        self.resultsTableView.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.resultsTableView.horizontalHeader().setDefaultSectionSize(self.FIELD_COLUMN_WIDTH)
+        self.resultsTableView.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        results_layout.addWidget(self.resultsTableView)
         button_layout = QHBoxLayout()
+        self.fitColumnsButton = QPushButton(self.tr("Fit Columns"))
+        self.fitColumnsButton.setToolTip(self.tr("Resize the result columns to fit their contents."))
         self.copyButton = QPushButton(self.tr("Copy Table"))
         self.exportButton = QPushButton(self.tr("Export Table"))
         button_layout.addStretch()
+        button_layout.addWidget(self.fitColumnsButton)
         button_layout.addWidget(self.copyButton); button_layout.addWidget(self.exportButton)
         results_layout.addLayout(button_layout)
         self.results_group_box.setLayout(results_layout)
@@ -278,13 +587,13 @@ class FieldProfilerDockWidget(QDockWidget):
 
     def populate_fields(self, layer):
         self.fieldListWidget.clear()
-        self.resultsTableWidget.clear()
-        self.resultsTableWidget.setRowCount(0)
-        self.resultsTableWidget.setColumnCount(0)
-        self.analysis_results_cache = OrderedDict()
+        self.resultsModel.clear()
+        self.analysis_results_cache = {}
         self.conversion_error_feature_ids_by_field = {}
         self.non_printable_char_feature_ids_by_field = {}
+        self._cancel_pending_analysis()
         self.progressBar.setVisible(False)
+        self._watch_layer_for_cache(layer if isinstance(layer, QgsVectorLayer) else None)
 
         if layer and isinstance(layer, QgsVectorLayer):
             self.fieldListWidget.setEnabled(True); self.selectedOnlyCheckbox.setEnabled(True); self.analyzeButton.setEnabled(True)
@@ -292,6 +601,23 @@ class FieldProfilerDockWidget(QDockWidget):
         else:
             self.fieldListWidget.setEnabled(False); self.selectedOnlyCheckbox.setEnabled(False); self.analyzeButton.setEnabled(False)
 
+    def _watch_layer_for_cache(self, layer):
+        # Cached field results are only valid for the current layer's data as it was analyzed.
+        self._field_results_cache = {}
+        if self._cache_layer is not None:
+            try:
+                self._cache_layer.dataChanged.disconnect(self._clear_field_results_cache)
+                self._cache_layer.subsetStringChanged.disconnect(self._clear_field_results_cache)
+            except (TypeError, RuntimeError): # Already disconnected or layer deleted
+                pass
+        self._cache_layer = layer
+        if layer is not None:
+            layer.dataChanged.connect(self._clear_field_results_cache)
+            layer.subsetStringChanged.connect(self._clear_field_results_cache)
+
+    def _clear_field_results_cache(self):
+        self._field_results_cache = {}
+
     def _get_detailed_options_state(self):
         return {
             'numeric_dist_shape': self.chk_numeric_dist_shape.isChecked(),
@@ -303,9 +629,23 @@ class FieldProfilerDockWidget(QDockWidget):
             'date_time_weekend': self.chk_date_time_weekend.isChecked(),
         }
 
+    def _cancel_pending_analysis(self):
+        # Workers cannot be interrupted; results they still deliver are ignored via the generation check.
+        self._analysis_generation += 1
+        if self._collection_task is not None:
+            try:
+                self._collection_task.cancel()
+            except RuntimeError: # Task already finished and deleted by the task manager
+                pass
+            self._collection_task = None
+        self._pending_fields = set()
+        self._active_workers = []
+        self.analyzeButton.setEnabled(True)
+
     def run_analysis(self):
-        self.resultsTableWidget.clear(); self.resultsTableWidget.setRowCount(0); self.resultsTableWidget.setColumnCount(0)
-        self.analysis_results_cache = OrderedDict()
+        self._cancel_pending_analysis()
+        self.resultsModel.clear()
+        self.analysis_results_cache = {}
         self.conversion_error_feature_ids_by_field = {}
         self.non_printable_char_feature_ids_by_field = {}
 
@@ -316,6 +656,7 @@ class FieldProfilerDockWidget(QDockWidget):
         self.current_decimal_places = self.decimalPlacesSpinBox.value()
         self._was_analyzing_selected_features = self.selectedOnlyCheckbox.isChecked()
         detailed_options = self._get_detailed_options_state()
+        self._pending_cache_keys = {}
 
         if not current_layer or not isinstance(current_layer, QgsVectorLayer):
             self.iface.messageBar().pushMessage(self.tr("Error"), self.tr("Please select a valid vector layer."), level=Qgis.Warning); return
@@ -346,20 +687,33 @@ class FieldProfilerDockWidget(QDockWidget):
             self.progressBar.setVisible(False); return
 
         self.iface.messageBar().pushMessage(self.tr("Info"), analysis_scope_message, level=Qgis.Info, duration=3)
-        QApplication.processEvents()
 
-        self.progressBar.setRange(0, feature_count_analyzed if feature_count_analyzed > 0 else 100)
+        # Percent of features read, then fields analyzed; busy indicator while reading an unknown number of features
+        self.progressBar.setRange(0, 100 if feature_count_analyzed > 0 else 0)
         self.progressBar.setValue(0); self.progressBar.setVisible(True)
 
-        field_data_collector = OrderedDict()
+        field_data_collector = {}
         qgs_fields_objects = current_layer.fields()
         field_metadata = {}
 
+        # Everything a field's results depend on besides the layer data itself
+        cache_scope = (current_layer.id(), self._selection_digest(selected_ids) if self._was_analyzing_selected_features else None,
+                       tuple(sorted(detailed_options.items())), self.current_decimal_places, self.current_limit_unique_display)
+
         valid_selected_field_names = []
         for field_name in selected_field_names_from_widget:
             field_index = qgs_fields_objects.lookupField(field_name)
             if field_index == -1:
                 self.analysis_results_cache[field_name] = {'Error': 'Field not found'}; continue
+
+            cache_key = (field_name,) + cache_scope
+            cached = self._field_results_cache.get(cache_key)
+            if cached is not None: # Unchanged inputs: reuse the results of an earlier run
+                self.analysis_results_cache[field_name], conversion_error_fids, non_printable_fids = cached
+                if conversion_error_fids: self.conversion_error_feature_ids_by_field[field_name] = conversion_error_fids
+                if non_printable_fids: self.non_printable_char_feature_ids_by_field[field_name] = non_printable_fids
+                continue
+            self._pending_cache_keys[field_name] = cache_key
             
             valid_selected_field_names.append(field_name)
             field_obj = qgs_fields_objects.field(field_index)
@@ -369,9 +723,7 @@ class FieldProfilerDockWidget(QDockWidget):
                 'non_printable_fids': [] 
             }
             if field_obj.isNumeric():
-                collector_init.update({'float_values': [], 'conversion_errors': 0, 'conversion_error_feature_ids': []})
-            if field_obj.type() in [QVariant.Date, QVariant.DateTime]:
-                 collector_init['original_variants'] = []
+                collector_init.update({'value_fids': array.array('q'), 'conversion_errors': 0, 'conversion_error_feature_ids': []})
 
             field_data_collector[field_name] = collector_init
         
@@ -379,99 +731,145 @@ class FieldProfilerDockWidget(QDockWidget):
             self.populate_results_table(self.analysis_results_cache, selected_field_names_from_widget)
             self.progressBar.setVisible(False); return
 
-        current_iterator = current_layer.getFeatures(request)
-        iteration_count = 0
-        try:
-            for feature in current_iterator:
-                iteration_count += 1
-                fid = feature.id()
-                for field_name in valid_selected_field_names:
-                    meta = field_metadata[field_name]
-                    collector = field_data_collector[field_name]
-                    val = feature[meta['index']]
-                    
-                    if meta['type'] in [QVariant.Date, QVariant.DateTime]:
-                        collector['original_variants'].append(val if (val is not None and not (hasattr(val, 'isNull') and val.isNull())) else None)
-
-                    if val is None or (hasattr(val, 'isNull') and val.isNull()):
-                        collector['null_count'] += 1
-                    else:
-                        collector['raw_values'].append(val)
-                        if meta['object'].isNumeric():
-                            try:
-                                collector['float_values'].append(float(val))
-                            except (ValueError, TypeError):
-                                collector['conversion_errors'] += 1
-                                collector['conversion_error_feature_ids'].append(fid)
-                        elif meta['type'] == QVariant.String:
-                            if detailed_options['text_rarity_nonprintable']:
-                                if self._has_non_printable_chars(str(val)):
-                                    collector['non_printable_fids'].append(fid)
-
-                if iteration_count % 100 == 0 or iteration_count == feature_count_analyzed:
-                    self.progressBar.setValue(iteration_count); QApplication.processEvents()
-        except Exception as e_iter:
-            for field_name in valid_selected_field_names: self.analysis_results_cache[field_name] = {'Error': f'Feature iteration error: {e_iter}'}
-            self.populate_results_table(self.analysis_results_cache, selected_field_names_from_widget)
-            self.progressBar.setVisible(False); return
-        
-        self.progressBar.setValue(feature_count_analyzed)
-
+        # Only the analyzed attributes are fetched, and no geometry; the provider skips decoding the rest
+        request.setSubsetOfAttributes([field_metadata[field_name]['index'] for field_name in valid_selected_field_names])
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+
+        # Per-field metadata resolved once, so the feature loop only works on locals
+        field_jobs = [(field_metadata[field_name]['index'], field_metadata[field_name]['object'].isNumeric(),
+                       field_metadata[field_name]['type'] == QVariant.String, field_data_collector[field_name])
+                      for field_name in valid_selected_field_names]
+        non_printable_check = self._has_non_printable_chars if detailed_options['text_rarity_nonprintable'] else None
+
+        # Features are read on a task manager thread; the GUI stays responsive without processEvents()
+        task = FeatureCollectionTask(self.tr("Field Profiler: reading features of {0}").format(current_layer.name()),
+                                     QgsVectorLayerFeatureSource(current_layer), request, field_jobs,
+                                     feature_count_analyzed, non_printable_check)
+        task.progressChanged.connect(partial(self._on_collection_progress, self._analysis_generation))
+        collection_context = {'field_names': valid_selected_field_names, 'header_field_names': selected_field_names_from_widget,
+                              'field_metadata': field_metadata, 'field_data_collector': field_data_collector,
+                              'detailed_options': detailed_options, 'feature_count_analyzed': feature_count_analyzed}
+        task.taskCompleted.connect(partial(self._on_features_collected, self._analysis_generation, collection_context))
+        task.taskTerminated.connect(partial(self._on_feature_collection_terminated, self._analysis_generation, task, collection_context))
+        self._collection_task = task # Keep the Python wrapper alive while the task manager runs it
+        self.analyzeButton.setEnabled(False)
+        QgsApplication.taskManager().addTask(task)
+
+    @staticmethod
+    def _selection_digest(selected_ids):
+        # Compact, order-independent key for a feature selection, so cache keys don't keep a copy of every id
+        sorted_ids = numpy.sort(numpy.fromiter(selected_ids, dtype=numpy.int64, count=len(selected_ids)))
+        return len(selected_ids), hashlib.blake2b(sorted_ids.tobytes(), digest_size=16).digest()
+
+    def _on_collection_progress(self, generation, progress):
+        if generation == self._analysis_generation: # A cancelled task may still report progress
+            self.progressBar.setValue(int(progress))
+
+    def _on_features_collected(self, generation, context):
+        if generation != self._analysis_generation:
+            return # Superseded run
+        self._collection_task = None
+        valid_selected_field_names = context['field_names']
+        field_metadata = context['field_metadata']
+        field_data_collector = context['field_data_collector']
+
+        # Feature ids must be recorded on the GUI thread; the statistics themselves run on the pool.
         for field_name in valid_selected_field_names:
             data = field_data_collector[field_name]
             meta = field_metadata[field_name]
-
             if meta['object'].isNumeric() and data.get('conversion_error_feature_ids'):
                 self.conversion_error_feature_ids_by_field[field_name] = data['conversion_error_feature_ids']
             if meta['type'] == QVariant.String and data.get('non_printable_fids'):
                 self.non_printable_char_feature_ids_by_field[field_name] = list(set(data['non_printable_fids'])) 
 
-            non_null_count = len(data['raw_values'])
-            percent_null = (data['null_count'] / feature_count_analyzed * 100) if feature_count_analyzed > 0 else 0
-            field_results = OrderedDict([('Null Count', data['null_count']), ('% Null', f"{percent_null:.2f}%"), ('Non-Null Count', non_null_count)])
-            
-            status_set = False
-            if non_null_count == 0:
-                if meta['object'].isNumeric() and data.get('conversion_errors', 0) > 0:
-                    field_results['Status'] = f"All values Null or conversion errors ({data['conversion_errors']})"
+        self._header_field_names = context['header_field_names']
+        self._pending_fields = set(valid_selected_field_names)
+        self.progressBar.setRange(0, len(valid_selected_field_names)); self.progressBar.setValue(0)
+
+        thread_pool = QThreadPool.globalInstance()
+        for field_name in valid_selected_field_names:
+            analyze_fn = partial(self._analyze_collected_field, field_data_collector[field_name], field_metadata[field_name],
+                                 context['detailed_options'], context['feature_count_analyzed'])
+            worker = AnalysisWorker(self._analysis_generation, field_name, analyze_fn)
+            worker.signals.analysisReady.connect(self._on_field_analysis_ready, Qt.QueuedConnection)
+            self._active_workers.append(worker)
+            thread_pool.start(worker)
+
+    def _on_feature_collection_terminated(self, generation, task, context):
+        if generation != self._analysis_generation:
+            return # Cancelled by a newer run or a layer change
+        self._collection_task = None
+        if task.exception is not None:
+            for field_name in context['field_names']: self.analysis_results_cache[field_name] = {'Error': f'Feature iteration error: {task.exception}'}
+            self.populate_results_table(self.analysis_results_cache, context['header_field_names'])
+        self.progressBar.setVisible(False)
+        self.analyzeButton.setEnabled(True)
+
+    def _analyze_collected_field(self, data, meta, detailed_options, feature_count_analyzed):
+        # Runs on a worker thread: no widget access here.
+        non_null_count = data['non_null_count']
+        percent_null = (data['null_count'] / feature_count_analyzed * 100) if feature_count_analyzed > 0 else 0
+        field_results = {'Null Count': data['null_count'], '% Null': f"{percent_null:.2f}%", 'Non-Null Count': non_null_count}
+        
+        status_set = False
+        if non_null_count == 0:
+            if meta['object'].isNumeric() and data.get('conversion_errors', 0) > 0:
+                field_results['Status'] = f"All values Null or conversion errors ({data['conversion_errors']})"
+            else:
+                field_results['Status'] = 'All Null or Empty'
+            status_set = True
+        
+        analysis_for_field = {}
+        if not status_set: 
+            try:
+                if meta['object'].isNumeric():
+                    analysis_for_field = self.analyze_numeric_field_from_list(data['float_values'], data.get('conversion_errors',0), detailed_options, non_null_count)
+                elif meta['type'] == QVariant.String:
+                    analysis_for_field = self.analyze_text_field(data['raw_values'], non_null_count, detailed_options)
+                elif meta['type'] in [QVariant.Date, QVariant.DateTime]:
+                    analysis_for_field = self.analyze_date_field_enhanced(data['raw_values'], non_null_count, detailed_options)
                 else:
-                    field_results['Status'] = 'All Null or Empty'
-                status_set = True
-            
-            analysis_for_field = {}
-            if not status_set: 
-                try:
-                    if meta['object'].isNumeric():
-                        analysis_for_field = self.analyze_numeric_field_from_list(data['float_values'], data.get('conversion_errors',0), detailed_options, non_null_count)
-                    elif meta['type'] == QVariant.String:
-                        analysis_for_field = self.analyze_text_field(data['raw_values'], non_null_count, detailed_options)
-                    elif meta['type'] in [QVariant.Date, QVariant.DateTime]:
-                        original_variants = data.get('original_variants', data['raw_values'])
-                        analysis_for_field = self.analyze_date_field_enhanced(original_variants, non_null_count, detailed_options)
-                    else:
-                        analysis_for_field = {'Status': 'Analysis not implemented for this type'}
-                except Exception as e_analysis:
-                    analysis_for_field = {'Error': f'Analysis function error: {e_analysis}'}
-            
-            field_results.update(analysis_for_field)
-
-            hint = "N/A"
-            if meta['type'] == QVariant.String and non_null_count > 0:
-                numeric_like_count = sum(1 for s_val in data['raw_values'] if str(s_val).replace('.', '', 1).strip().isdigit()) # strip to handle " 123 "
-                if numeric_like_count / non_null_count > 0.9: 
-                    hint = "High % of numeric-like strings. Consider if this field should be numeric."
-            elif meta['object'].isNumeric() and non_null_count > 0:
-                if field_results.get('Variety (distinct)', float('inf')) < 15 and non_null_count > 20:
-                     hint = "Low variety for a numeric field. Consider if this is categorical or a code."
-
-            field_results['Data Type Mismatch Hint'] = hint
-            self.analysis_results_cache[field_name] = field_results
+                    analysis_for_field = {'Status': 'Analysis not implemented for this type'}
+            except Exception as e_analysis:
+                analysis_for_field = {'Error': f'Analysis function error: {e_analysis}'}
         
-        self.populate_results_table(self.analysis_results_cache, selected_field_names_from_widget)
-        self.progressBar.setVisible(False); QApplication.processEvents()
+        field_results.update(analysis_for_field)
+
+        hint = "N/A"
+        if meta['type'] == QVariant.String and non_null_count > 0:
+            # str -> drop one '.' -> strip (to handle " 123 ") -> isdigit, chained with map() so the iteration runs in C
+            numeric_like_count = sum(map(str.isdigit, map(str.strip, map(methodcaller('replace', '.', '', 1), map(str, data['raw_values'])))))
+            if numeric_like_count / non_null_count > 0.9: 
+                hint = "High % of numeric-like strings. Consider if this field should be numeric."
+        elif meta['object'].isNumeric() and non_null_count > 0:
+            if field_results.get('Variety (distinct)', float('inf')) < 15 and non_null_count > 20:
+                 hint = "Low variety for a numeric field. Consider if this is categorical or a code."
+
+        field_results['Data Type Mismatch Hint'] = hint
+        return field_results
+
+    def _on_field_analysis_ready(self, generation, field_name, field_results):
+        if generation != self._analysis_generation or field_name not in self._pending_fields:
+            return # Result of a cancelled/superseded run
+        self.analysis_results_cache[field_name] = field_results
+        self._pending_fields.discard(field_name)
+        cache_key = self._pending_cache_keys.pop(field_name, None)
+        if cache_key is not None and 'Error' not in field_results:
+            self._field_results_cache[cache_key] = (field_results, self.conversion_error_feature_ids_by_field.get(field_name),
+                                                    self.non_printable_char_feature_ids_by_field.get(field_name))
+            if len(self._field_results_cache) > self.FIELD_RESULTS_CACHE_SIZE:
+                self._field_results_cache.pop(next(iter(self._field_results_cache))) # Drop the oldest entry
+        self.progressBar.setValue(self.progressBar.value() + 1)
+        if self._pending_fields:
+            return
+
+        self._active_workers = []
+        self.populate_results_table(self.analysis_results_cache, self._header_field_names)
+        self.progressBar.setVisible(False)
+        self.analyzeButton.setEnabled(True)
 
     def populate_results_table(self, results_data, field_names_for_header):
-        self.resultsTableWidget.clear()
+        self.resultsModel.clear()
         if not results_data and not field_names_for_header: return
         all_stat_names_from_data = set()
         for field_name, field_data in results_data.items(): all_stat_names_from_data.update(field_data.keys())
@@ -483,18 +881,8 @@ class FieldProfilerDockWidget(QDockWidget):
         stat_rows_ordered = [] # This will hold the final ordered list of statistic keys (original English keys)
         seen_keys_for_order = set()
         
-        # Combine all predefined STAT_KEYS lists into a single ordered list without duplicates
-        predefined_order_source = []
-        temp_seen_for_predefined_order = set()
-        for key_list in [self.STAT_KEYS_NUMERIC, self.STAT_KEYS_TEXT, self.STAT_KEYS_DATE, 
-                         self.STAT_KEYS_OTHER, self.STAT_KEYS_ERROR]:
-            for key in key_list:
-                if key not in temp_seen_for_predefined_order:
-                    predefined_order_source.append(key)
-                    temp_seen_for_predefined_order.add(key)
-
-        # Add keys from predefined_order_source if they are present in the actual results
-        for key in predefined_order_source:
+        # Add keys from the predefined order if they are present in the actual results
+        for key in self.PREDEFINED_STAT_ORDER:
             if key in all_displayable_stat_names and key not in seen_keys_for_order:
                 stat_rows_ordered.append(key)
                 seen_keys_for_order.add(key)
@@ -503,185 +891,187 @@ class FieldProfilerDockWidget(QDockWidget):
         extras = sorted([key for key in all_displayable_stat_names if key not in seen_keys_for_order])
         stat_rows_ordered.extend(extras)
         
-        # --- Setup table dimensions and headers ---
-        num_rows = len(stat_rows_ordered)
-        num_cols = len(field_names_for_header) + 1 # +1 for the statistic name column
-        self.resultsTableWidget.setRowCount(num_rows)
-        self.resultsTableWidget.setColumnCount(num_cols)
-        
-        # Headers: First column is "Statistic", others are field names
+        # --- Headers: First column is "Statistic", others are field names ---
         headers = [self.tr("Statistic")] + field_names_for_header
-        self.resultsTableWidget.setHorizontalHeaderLabels(headers)
-        
-        quality_keywords = ['%', 'Null', 'Empty', 'Error', 'Outlier', 'Spaces', 'Variance', 'Flag', 'Conversion', 'Mismatch', 'Non-Printable'] 
-        dp = self.current_decimal_places # Decimal places for formatting floats
+        model_rows = []
         
-        # --- Populate table cells ---
-        for r, original_stat_key in enumerate(stat_rows_ordered): # original_stat_key is the English key
-            # Statistic Name Item (First Column)
-            stat_item = QTableWidgetItem(self.tr(original_stat_key)) # Display translated name
-            stat_item.setData(Qt.UserRole, original_stat_key) # Store original English key
-            stat_item.setToolTip(self.stat_tooltips.get(original_stat_key, self.tr("No description available.")))
+        # Check boolean quality issues for the first field to color the statistic name row
+        # This still assumes the first field is representative for row-level coloring
+        first_field_data = results_data.get(field_names_for_header[0], {}) if field_names_for_header else {}
+        no_description = self.tr("No description available.") # Translated once, not per row
+
+        # --- Per-row statistic name and style; cell texts are formatted lazily by ResultsModel.data() ---
+        for original_stat_key in stat_rows_ordered: # original_stat_key is the English key
+            stat_label = self.tr(original_stat_key) # Display translated name
+            stat_tooltip = self.stat_tooltips.get(original_stat_key, no_description)
             
-            is_quality_issue = any(keyword.lower() in original_stat_key.lower() for keyword in quality_keywords) or \
-                               original_stat_key == 'Error'
+            is_quality_issue, is_distribution_stat, key_align_right = self._get_stat_key_style(original_stat_key)
             
-            # Check boolean quality issues for the first field to color the statistic name row
-            # This still assumes the first field is representative for row-level coloring
-            first_field_name_for_color = field_names_for_header[0] if field_names_for_header else None
-            if first_field_name_for_color:
-                 first_field_data = results_data.get(first_field_name_for_color, {})
-                 if original_stat_key == 'Normality (Likely Normal)' and first_field_data.get(original_stat_key) is False:
-                     is_quality_issue = True
-                 if original_stat_key == 'Low Variance Flag' and first_field_data.get(original_stat_key) is True:
-                     is_quality_issue = True
+            if original_stat_key == 'Normality (Likely Normal)' and first_field_data.get(original_stat_key) is False:
+                is_quality_issue = True
+            if original_stat_key == 'Low Variance Flag' and first_field_data.get(original_stat_key) is True:
+                is_quality_issue = True
 
             if is_quality_issue:
-                stat_item.setBackground(QtGui.QColor(255, 240, 240)) # Light red
-            elif original_stat_key.startswith('%') or "Pctl" in original_stat_key or original_stat_key in ['Skewness', 'Kurtosis']:
-                stat_item.setBackground(QtGui.QColor(240, 240, 255)) # Light blue
+                stat_background = self.QUALITY_ROW_BRUSH
+            elif is_distribution_stat:
+                stat_background = self.DISTRIBUTION_ROW_BRUSH
             else:
-                stat_item.setBackground(QtGui.QColor(230, 230, 230)) # Light grey
+                stat_background = self.DEFAULT_ROW_BRUSH
             
-            self.resultsTableWidget.setItem(r, 0, stat_item)
-
-            # Data Cells (Subsequent Columns)
-            for c, field_name in enumerate(field_names_for_header):
-                field_data = results_data.get(field_name, {})
-                value = field_data.get(original_stat_key, "") # Get value using original_stat_key
-                display_text = ""
-                
-                if isinstance(value, bool):
-                    display_text = str(value)
-                elif isinstance(value, float):
-                    if original_stat_key == 'Normality (Shapiro-Wilk p)':
-                         display_text = f"{value:.4g}" if not numpy.isnan(value) else "N/A"
-                    else:
-                         display_text = f"{value:.{dp}f}" if not numpy.isnan(value) else "N/A"
-                elif isinstance(value, list) and original_stat_key != 'Mode(s)': # Check original_stat_key here
-                    display_text = "; ".join(map(str, value))
-                elif isinstance(value, list) and original_stat_key == 'Mode(s)': # Check original_stat_key here
-                    # Format numbers in mode list with specified decimal places
-                    formatted_modes = []
-                    for v_mode in value:
-                        if isinstance(v_mode, (int, float)):
-                            try:
-                                formatted_modes.append(f"{float(v_mode):.{dp}f}")
-                            except ValueError: # Handle potential non-numeric items if list is mixed
-                                formatted_modes.append(str(v_mode))
-                        else:
-                            formatted_modes.append(str(v_mode))
-                    display_text = ", ".join(formatted_modes)
-                else:
-                    display_text = str(value)
-                
-                item = QTableWidgetItem(display_text)
-                
-                align_right_keywords = ['Count', 'Error', 'Outlier', 'Zero', 'Positive', 'Negative', 'Space', 'Empty', 'Value', 'Length', 'Pctl', 'Optimal Bins']
-                align_right = isinstance(value, (int, float, bool, numpy.number)) or \
-                              '%' in original_stat_key or \
-                              any(kw in original_stat_key for kw in align_right_keywords) # Check original_stat_key
-
-                item.setTextAlignment(Qt.AlignVCenter | (Qt.AlignRight if align_right else Qt.AlignLeft))
-                
-                if isinstance(value, str) and ('\n' in value or len(value) > 60):
-                    item.setToolTip(value) # Show full value in tooltip if long or multiline
-                elif item.text() == "N/A (Scipy not found)" or item.text() == "N/A (>=3 values needed)" or item.text() == "N/A (<3 valid)":
-                    item.setForeground(QtGui.QBrush(Qt.gray)) # Grey out unavailable stats
-
-                self.resultsTableWidget.setItem(r, c + 1, item)
-        
-        self.resultsTableWidget.resizeColumnsToContents()
+            model_rows.append((original_stat_key, stat_label, stat_tooltip, stat_background, key_align_right))
+
+        self.resultsModel.set_results(headers, field_names_for_header, results_data, model_rows, self.current_decimal_places)
+        self.resultsTableView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder) # New results start in statistics order
+        self.resultsTableView.setColumnWidth(0, self.STAT_NAME_COLUMN_WIDTH)
+        self._set_sampled_column_widths(headers)
+
+    def _set_sampled_column_widths(self, headers):
+        # Width of each field column from its header and its first few non-empty cells (a numeric field's
+        # rows come first, so other fields are blank there), instead of resizeColumnsToContents() measuring
+        # every cell; "Fit Columns" still does the full pass. Never narrower than the default width.
+        header_metrics = self.resultsTableView.horizontalHeader().fontMetrics()
+        cell_metrics = self.resultsTableView.fontMetrics()
+        if hasattr(cell_metrics, 'horizontalAdvance'):
+            header_advance, cell_advance = header_metrics.horizontalAdvance, cell_metrics.horizontalAdvance
+        else: # Qt < 5.11 (QGIS 3.0/3.2) only has width()
+            header_advance, cell_advance = header_metrics.width, cell_metrics.width
+        model = self.resultsModel
+        row_count = model.rowCount()
+        for c in range(1, len(headers)):
+            cell_texts = (model.index(r, c).data() for r in range(row_count))
+            sampled_texts = islice(filter(None, cell_texts), self.COLUMN_WIDTH_SAMPLE_ROWS)
+            width = max([header_advance(headers[c])] + [cell_advance(line) for text in sampled_texts for line in text.split('\n')])
+            self.resultsTableView.setColumnWidth(c, max(width + self.COLUMN_WIDTH_PADDING, self.FIELD_COLUMN_WIDTH))
+
+    def _get_stat_key_style(self, stat_key):
+        # Keyword-based classification only depends on the key, so it is computed once per key.
+        style = self._stat_key_styles.get(stat_key)
+        if style is None:
+            stat_key_lower = stat_key.lower()
+            is_quality_issue = any(keyword in stat_key_lower for keyword in self.QUALITY_KEYWORDS_LOWER) or stat_key == 'Error'
+            is_distribution_stat = stat_key.startswith('%') or "Pctl" in stat_key or stat_key in ['Skewness', 'Kurtosis']
+            align_right = '%' in stat_key or any(kw in stat_key for kw in self.ALIGN_RIGHT_KEYWORDS)
+            style = (is_quality_issue, is_distribution_stat, align_right)
+            self._stat_key_styles[stat_key] = style
+        return style
+
+    def _build_empty_numeric_results(self):
+        # Placeholder values for a numeric field without any valid data; built once per instance.
+        empty_results = {}
+        for key in self.STAT_KEYS_NUMERIC:
+            if key not in ['Non-Null Count', 'Null Count', '% Null', 'Conversion Errors', 'Status']:
+                if key in ['Variety (distinct)', 'Zeros', 'Positives', 'Negatives', 'Outliers (IQR)', 'Integer Values', 'Decimal Values', '% Outliers', 'Min Outlier', 'Max Outlier']: empty_results[key] = 0
+                elif key in ['Low Variance Flag', 'Normality (Likely Normal)']: empty_results[key] = False
+                elif key == '% Integer Values': empty_results[key] = f"{0.0:.2f}%"
+                else: empty_results[key] = 'N/A'
+        return empty_results
 
     def analyze_numeric_field_from_list(self, non_null_values_list_float, conversion_errors, options, total_non_null_count):
-        results = OrderedDict()
+        results = {}
         results['Conversion Errors'] = conversion_errors
         
         try:
-            data_np = numpy.array(non_null_values_list_float, dtype=float)
-            if numpy.any(numpy.isinf(data_np)): 
+            if isinstance(non_null_values_list_float, numpy.ndarray):
+                data_np = non_null_values_list_float
+            elif isinstance(non_null_values_list_float, array.array):
+                data_np = numpy.frombuffer(non_null_values_list_float, dtype=numpy.float64) # Zero-copy view of the collector buffer
+            else:
+                data_np = numpy.fromiter(non_null_values_list_float, dtype=numpy.float64, count=len(non_null_values_list_float))
+            # One isfinite pass covers both the infinities dropped here and the NaNs skipped below;
+            # for all-finite data (the usual case) neither step copies the array.
+            finite_mask = numpy.isfinite(data_np)
+            all_finite = bool(finite_mask.all())
+            if not all_finite:
+                valid_np = data_np[finite_mask]
                 data_np = data_np[~numpy.isinf(data_np)]
         except Exception: 
             data_np = numpy.array([], dtype=float) 
+            all_finite = True
 
         count_val = len(data_np)
 
         if count_val == 0:
             results['Status'] = 'No valid numeric data' if conversion_errors == 0 else f'No valid data ({conversion_errors} conversion errors)'
-            for key in self.STAT_KEYS_NUMERIC:
-                if key not in ['Non-Null Count', 'Null Count', '% Null', 'Conversion Errors', 'Status']:
-                    if key in ['Variety (distinct)', 'Zeros', 'Positives', 'Negatives', 'Outliers (IQR)', 'Integer Values', 'Decimal Values', '% Outliers', 'Min Outlier', 'Max Outlier']: results[key] = 0
-                    elif key in ['Low Variance Flag', 'Normality (Likely Normal)']: results[key] = False
-                    elif key == '% Integer Values': results[key] = f"{0.0:.2f}%"
-                    else: results[key] = 'N/A'
+            results.update(self._empty_numeric_results)
             return results
 
-        min_val = numpy.nanmin(data_np) if count_val > 0 else numpy.nan
-        max_val = numpy.nanmax(data_np) if count_val > 0 else numpy.nan
-        sum_val = numpy.nansum(data_np) if count_val > 0 else numpy.nan
-        mean_val = numpy.nanmean(data_np) if count_val > 0 else numpy.nan
-        median_val = numpy.nanmedian(data_np) if count_val > 0 else numpy.nan
+        if all_finite:
+            valid_np = data_np # NaN-free values, shared by the stats below that must skip NaN
+        # One sort serves min/max, every percentile and the distinct values with their counts
+        sorted_np = numpy.sort(valid_np)
+        valid_count = sorted_np.size
+
+        min_val = sorted_np[0] if valid_count > 0 else numpy.nan
+        max_val = sorted_np[-1] if valid_count > 0 else numpy.nan
+        sum_val = valid_np.sum()
+        mean_val = sum_val / valid_count if valid_count > 0 else numpy.nan # Same as nanmean, without a second pass
+        # Median, quartiles and advanced percentiles indexed straight off the sorted array
+        percentiles_to_calc = [50, 25, 75]
+        if options.get('numeric_adv_percentiles', False):
+            percentiles_to_calc += [1, 5, 95, 99]
+        if valid_count > 0:
+            pctl_values = self._sorted_percentiles(sorted_np, percentiles_to_calc)
+        else:
+            pctl_values = numpy.full(len(percentiles_to_calc), numpy.nan)
+        median_val = pctl_values[0]
         
         results['Min'] = min_val; results['Max'] = max_val
         results['Range'] = max_val - min_val if not (numpy.isnan(min_val) or numpy.isnan(max_val)) else numpy.nan
         results['Sum'] = sum_val; results['Mean'] = mean_val; results['Median'] = median_val
 
-        std_dev_pop = numpy.std(data_np) if count_val > 0 else numpy.nan
+        if valid_count > 0:
+            deviations = valid_np - mean_val
+            std_dev_pop = numpy.sqrt(numpy.square(deviations).sum() / valid_count) # Reuses the mean above, NaN skipped like the other stats
+        else:
+            std_dev_pop = numpy.nan
         results['Stdev (pop)'] = std_dev_pop
 
-        modes_val = 'N/A'
-        if count_val > 0:
-            if SCIPY_AVAILABLE:
-                try: 
-                    mode_res = scipy_stats.mode(data_np, nan_policy='omit', keepdims=False) 
-                    if hasattr(mode_res, 'mode') and numpy.size(mode_res.mode) > 0:
-                        modes_val = list(mode_res.mode) if isinstance(mode_res.mode, numpy.ndarray) else [mode_res.mode]
-                    elif not hasattr(mode_res, 'mode') and isinstance(mode_res, tuple) and len(mode_res) > 0: # Older scipy
-                        if numpy.size(mode_res[0]) > 0:
-                             modes_val = list(mode_res[0])
-                        else: modes_val = 'N/A (no mode or all unique)'
-                    else: 
-                        modes_val = 'N/A (no mode or all unique)'
-                except Exception:
-                     modes_val = 'N/A (mode error)'
-            else: 
-                try:
-                    # Ensure data_np is not empty before tolist()
-                    modes_val = statistics.multimode(data_np.tolist()) if data_np.size > 0 else 'N/A (no data)'
-                except statistics.StatisticsError: # No unique mode or data is empty
-                    modes_val = 'N/A (no unique mode / empty)'
-                except TypeError: # if data_np contains NaNs, multimode might fail
-                    try:
-                        non_nan_list = [x for x in data_np.tolist() if not numpy.isnan(x)]
-                        if non_nan_list:
-                            modes_val = statistics.multimode(non_nan_list)
-                        else:
-                            modes_val = 'N/A (all NaN or empty)'
-                    except statistics.StatisticsError:
-                         modes_val = 'N/A (no unique mode after NaN removal)'
+        # Distinct values and their counts straight from the sorted array: a new value starts wherever it changes
+        if valid_count > 0:
+            is_first = numpy.empty(valid_count, dtype=bool); is_first[0] = True
+            numpy.not_equal(sorted_np[1:], sorted_np[:-1], out=is_first[1:])
+            unique_vals = sorted_np[is_first]
+            unique_counts = numpy.diff(numpy.append(numpy.flatnonzero(is_first), valid_count))
+        else:
+            unique_vals = unique_counts = numpy.array([], dtype=numpy.int64)
+        modes_val = 'N/A (all NaN or empty)'
+        if unique_counts.size > 0:
+            max_count = unique_counts.max()
+            if max_count == 1 and unique_counts.size > 1:
+                modes_val = 'N/A (no mode or all unique)'
+            else:
+                modes_val = unique_vals[unique_counts == max_count].tolist() # All tied modes, ascending
 
         results['Mode(s)'] = modes_val
-
-        results['Variety (distinct)'] = len(numpy.unique(data_np[~numpy.isnan(data_np)])) if count_val > 0 else 0
+        results['Variety (distinct)'] = len(unique_vals)
         
         q1, q3, iqr_val = numpy.nan, numpy.nan, numpy.nan
         outlier_count = 0
         min_outlier_val, max_outlier_val, percent_outliers = numpy.nan, numpy.nan, 0.0 # Default percent_outliers to 0.0
 
+        adv_pctl_values = None
         if count_val > 0:
-            q1 = numpy.nanpercentile(data_np, 25)
-            q3 = numpy.nanpercentile(data_np, 75)
+            q1, q3 = pctl_values[1], pctl_values[2]
+            adv_pctl_values = pctl_values[3:]
             if not (numpy.isnan(q1) or numpy.isnan(q3)):
                 iqr_val = q3 - q1
                 if options.get('numeric_outlier_details', True) and not numpy.isnan(iqr_val) : # Ensure iqr_val is not NaN
                     lower_bound = q1 - 1.5 * iqr_val
                     upper_bound = q3 + 1.5 * iqr_val
-                    outliers_bool = (data_np < lower_bound) | (data_np > upper_bound)
-                    outliers_vals = data_np[outliers_bool & ~numpy.isnan(data_np)] 
-                    outlier_count = len(outliers_vals)
-                    if outlier_count > 0:
-                        min_outlier_val = numpy.min(outliers_vals)
-                        max_outlier_val = numpy.max(outliers_vals)
+                    # Outliers are the two ends of the sorted array: binary searches instead of scanning it.
+                    below_count = int(numpy.searchsorted(sorted_np, lower_bound, side='left'))
+                    above_count = valid_count - int(numpy.searchsorted(sorted_np, upper_bound, side='right'))
+                    outlier_count = below_count + above_count
+                    # The overall min/max is the extreme outlier whenever that side has any outliers.
+                    if below_count > 0:
+                        min_outlier_val = min_val
+                    elif above_count > 0:
+                        min_outlier_val = sorted_np[valid_count - above_count]
+                    if above_count > 0:
+                        max_outlier_val = max_val
+                    elif below_count > 0:
+                        max_outlier_val = sorted_np[below_count - 1]
                     # Calculate percent_outliers based on count_val (total non-NaN valid numerics)
                     percent_outliers = (outlier_count / count_val * 100.0) if count_val > 0 else 0.0
 
@@ -701,9 +1091,12 @@ class FieldProfilerDockWidget(QDockWidget):
         elif results['Variety (distinct)'] == 1 and count_val > 1: low_variance = True
         results['Low Variance Flag'] = low_variance
         
-        results['Zeros'] = numpy.sum(data_np == 0) if count_val > 0 else 0
-        results['Positives'] = numpy.sum(data_np > 0) if count_val > 0 else 0
-        results['Negatives'] = numpy.sum(data_np < 0) if count_val > 0 else 0
+        results['Zeros'], results['Positives'], results['Negatives'] = 0, 0, 0
+        if count_val > 0:
+            # Sign counts from where 0 falls in the sorted array (NaN is not in it)
+            first_zero = int(numpy.searchsorted(sorted_np, 0.0, side='left'))
+            first_positive = int(numpy.searchsorted(sorted_np, 0.0, side='right'))
+            results['Negatives'], results['Zeros'], results['Positives'] = first_zero, first_positive - first_zero, valid_count - first_positive
         
         cv = numpy.nan
         if not numpy.isnan(mean_val) and mean_val != 0 and not numpy.isnan(std_dev_pop):
@@ -711,8 +1104,8 @@ class FieldProfilerDockWidget(QDockWidget):
         results['CV %'] = cv
 
         if options.get('numeric_int_decimal', False) and count_val > 0:
-            valid_data_for_int_check = data_np[~numpy.isnan(data_np)] 
-            integer_values_count = numpy.sum(valid_data_for_int_check == numpy.floor(valid_data_for_int_check))
+            valid_data_for_int_check = valid_np
+            integer_values_count = numpy.count_nonzero(valid_data_for_int_check == numpy.floor(valid_data_for_int_check))
             results['Integer Values'] = int(integer_values_count)
             results['Decimal Values'] = len(valid_data_for_int_check) - int(integer_values_count) 
             results['% Integer Values'] = (int(integer_values_count) / len(valid_data_for_int_check) * 100.0) if len(valid_data_for_int_check) > 0 else 0.0
@@ -741,13 +1134,15 @@ class FieldProfilerDockWidget(QDockWidget):
 
 
         if options.get('numeric_dist_shape', False) and SCIPY_AVAILABLE and count_val > 0:
-            data_for_scipy = data_np[~numpy.isnan(data_np)] 
+            data_for_scipy = valid_np
             if len(data_for_scipy) > 0:
-                results['Skewness'] = scipy_stats.skew(data_for_scipy) if len(data_for_scipy) > 0 else numpy.nan
-                results['Kurtosis'] = scipy_stats.kurtosis(data_for_scipy, fisher=True) if len(data_for_scipy) > 0 else numpy.nan
+                results['Skewness'], results['Kurtosis'] = self._skew_and_kurtosis(deviations, mean_val) # Deviations from the stdev above
                 if len(data_for_scipy) >= 3: 
                     try:
-                        shapiro_stat, shapiro_p = scipy_stats.shapiro(data_for_scipy)
+                        shapiro_input = data_for_scipy
+                        if len(shapiro_input) > SHAPIRO_MAX_SAMPLE: # Fixed seed keeps the result reproducible
+                            shapiro_input = numpy.random.default_rng(SHAPIRO_SAMPLE_SEED).choice(shapiro_input, size=SHAPIRO_MAX_SAMPLE, replace=False)
+                        shapiro_stat, shapiro_p = scipy_stats.shapiro(shapiro_input)
                         results['Normality (Shapiro-Wilk p)'] = shapiro_p
                         results['Normality (Likely Normal)'] = bool(shapiro_p > 0.05) 
                     except ValueError as e_shapiro: # Handles cases like "Data must be at least 3 samples" or "Data must be distinct"
@@ -771,18 +1166,11 @@ class FieldProfilerDockWidget(QDockWidget):
 
 
         if options.get('numeric_adv_percentiles', False) and count_val > 0:
-            percentiles_to_calc = [1, 5, 95, 99]
-            # Ensure data_np is not all NaNs before calling nanpercentile
-            if not numpy.all(numpy.isnan(data_np)):
-                pctl_values = numpy.nanpercentile(data_np, percentiles_to_calc)
-                results['1st Pctl'] = pctl_values[0]
-                results['5th Pctl'] = pctl_values[1]
-                results['95th Pctl'] = pctl_values[2]
-                results['99th Pctl'] = pctl_values[3]
-            else:
-                nan_val = numpy.nan
-                results['1st Pctl'] = nan_val; results['5th Pctl'] = nan_val
-                results['95th Pctl'] = nan_val; results['99th Pctl'] = nan_val
+            # Computed together with Q1/Q3 above; all-NaN data yields NaN here.
+            results['1st Pctl'] = adv_pctl_values[0]
+            results['5th Pctl'] = adv_pctl_values[1]
+            results['95th Pctl'] = adv_pctl_values[2]
+            results['99th Pctl'] = adv_pctl_values[3]
         else:
             opt_na_msg = "N/A (Opt.)"
             results['1st Pctl'] = opt_na_msg; results['5th Pctl'] = opt_na_msg
@@ -790,14 +1178,41 @@ class FieldProfilerDockWidget(QDockWidget):
             
         return results
 
+    @staticmethod
+    def _sorted_percentiles(sorted_values, percentiles):
+        # numpy.percentile's default 'linear' method on an already sorted array: the neighbours of each
+        # virtual index are read directly, without the copy and partitioning numpy.percentile does.
+        virtual_indexes = (sorted_values.size - 1) * (numpy.asarray(percentiles, dtype=numpy.float64) / 100)
+        below = numpy.floor(virtual_indexes).astype(numpy.intp)
+        above = numpy.minimum(below + 1, sorted_values.size - 1)
+        gamma = virtual_indexes - below
+        low_values, high_values = sorted_values[below], sorted_values[above]
+        diff = high_values - low_values
+        # Same interpolation form as numpy (from the nearer neighbour), so results match it exactly
+        return numpy.where(gamma >= 0.5, high_values - diff * (1 - gamma), low_values + diff * gamma)
+
+    @staticmethod
+    def _skew_and_kurtosis(dev, mean):
+        # Both from the same central moments of the deviations from the mean; matches scipy.stats.skew/kurtosis
+        # with their defaults (biased, Fisher kurtosis), including their NaN cutoff m2 <= (eps * mean)**2
+        # for (near) constant data.
+        dev2 = dev * dev
+        m2 = dev2.mean()
+        if m2 <= (numpy.finfo(dev.dtype).eps * mean) ** 2:
+            return numpy.nan, numpy.nan
+        m3 = (dev2 * dev).mean()
+        m4 = (dev2 * dev2).mean()
+        return m3 / m2 ** 1.5, m4 / (m2 * m2) - 3.0
+
     def _has_non_printable_chars(self, text_value):
         if not isinstance(text_value, str): return False
-        allowed_control = {'\t', '\n', '\r'} 
-        return any(not c.isprintable() and c not in allowed_control for c in text_value)
+        if text_value.isprintable(): return False # C-level scan, covers the vast majority of values
+        return not text_value.translate(ALLOWED_CONTROL_CHARS_DELETE).isprintable() # Also C-level, for any script
 
 
     def analyze_text_field(self, values, non_null_count, options):
-        results = OrderedDict(); dp = self.current_decimal_places
+        results = {}; dp = self.current_decimal_places
+        pct = f"{{:.{dp}f}}%".format; zero_percent = pct(0.0) # Format spec parsed once per call
         
         if non_null_count == 0: 
             results['Status'] = 'No text data'
@@ -805,101 +1220,117 @@ class FieldProfilerDockWidget(QDockWidget):
                  if key not in ['Non-Null Count', 'Null Count', '% Null', 'Status']:
                     if key in ['Empty Strings', 'Leading/Trailing Spaces', 'Internal Multiple Spaces', 
                                'Variety (distinct)', 'Values Occurring Once', 'Non-Printable Chars Count']: results[key] = 0
-                    elif key == '% Empty': results[key] = f"{0.0:.{dp}f}%"
-                    elif key.startswith('%') and ('Case' in key): results[key] = f"{0.0:.{dp}f}%" 
+                    elif key == '% Empty': results[key] = zero_percent
+                    elif key.startswith('%') and ('Case' in key): results[key] = zero_percent 
                     else: results[key] = 'N/A'
             return results
 
-        str_values = [str(v) if v is not None else "" for v in values] # Ensure all are strings, handle None as empty
+        # Ensure all are strings, handle None as empty; collected values are never None, so map() in C is the usual path
+        str_values = list(map(str, values)) if None not in values else [str(v) if v is not None else "" for v in values]
 
         empty_string_count = str_values.count('')
         percent_empty = (empty_string_count / non_null_count * 100.0) if non_null_count > 0 else 0.0
         results['Empty Strings'] = empty_string_count
-        results['% Empty'] = f"{percent_empty:.{dp}f}%" 
+        results['% Empty'] = pct(percent_empty) 
         
         non_empty_str_values = [s for s in str_values if s] 
         count_non_empty = len(non_empty_str_values)
 
+        value_counts = Counter(str_values) 
+        results['Variety (distinct)'] = len(value_counts)
+        # The per-value checks below run once per distinct value, weighted by its count
+        # (dictionary encoding): repeated values, the common case for text attributes, are checked once.
+        distinct_non_empty = [s for s in value_counts if s]
+        distinct_counts = numpy.fromiter(map(value_counts.__getitem__, distinct_non_empty), dtype=numpy.int64, count=len(distinct_non_empty))
+
         min_len, max_len, avg_len_val = 'N/A', 'N/A', 'N/A'
         if count_non_empty > 0:
-            lengths = [len(s) for s in non_empty_str_values]
-            min_len, max_len, avg_len_val = min(lengths), max(lengths), statistics.mean(lengths)
+            lengths = numpy.fromiter(map(len, distinct_non_empty), dtype=numpy.int64, count=len(distinct_non_empty))
+            min_len, max_len, avg_len_val = int(lengths.min()), int(lengths.max()), float(numpy.dot(lengths, distinct_counts) / count_non_empty)
         results['Min Length'] = min_len; results['Max Length'] = max_len
         results['Avg Length'] = f"{avg_len_val:.{dp}f}" if isinstance(avg_len_val, float) else avg_len_val
         
-        value_counts = Counter(str_values) 
-        results['Variety (distinct)'] = len(value_counts)
-        
-        sorted_counts = sorted(value_counts.items(), key=lambda item: (-item[1], item[0]))
-        top_unique_list = []; actual_first_unique_value_for_selection = None
         limit_unique = self.current_limit_unique_display
-        if sorted_counts:
-            actual_first_unique_value_for_selection = sorted_counts[0][0]
-            for i, (val_str, count) in enumerate(sorted_counts):
-                if i >= limit_unique: break
+        # Only the shown entries are selected (same (-count, value) order as a full sort)
+        top_counts = heapq.nsmallest(limit_unique, value_counts.items(), key=lambda item: (-item[1], item[0]))
+        top_unique_list = []; actual_first_unique_value_for_selection = None
+        tr = self.tr
+        if top_counts:
+            actual_first_unique_value_for_selection = top_counts[0][0]
+            for val_str, count in top_counts:
                 display_val_preview = f"'{val_str[:50]}{'...' if len(val_str) > 50 else ''}'"
-                if val_str == "": display_val_preview = self.tr("'(Empty String)'")
+                if val_str == "": display_val_preview = tr("'(Empty String)'")
                 top_unique_list.append(f"{display_val_preview}: {count}")
         results['Unique Values (Top)'] = "\n".join(top_unique_list) if top_unique_list else "N/A"
         if top_unique_list: # Store even if None or empty string
             results['Unique Values (Top)_actual_first_value'] = actual_first_unique_value_for_selection
         
-        if options.get('text_rarity_nonprintable', False):
+        check_case = options.get('text_case_analysis', False)
+        check_rarity_nonprintable = options.get('text_rarity_nonprintable', False)
+        # One C-level scan of all distinct values joined: only if that finds a non-printable
+        # character do the values need to be checked one by one.
+        check_non_printable = check_rarity_nonprintable and self._has_non_printable_chars("".join(distinct_non_empty))
+
+        # Single pass over the distinct non-empty strings for the per-value flags and patterns
+        # (empty strings never match any of them).
+        upper_count = lower_count = title_count = mixed_count = 0
+        lead_trail_count = multi_space_count = non_printable_count = 0
+        emails_found = urls_found = 0
+        has_non_printable_chars = self._has_non_printable_chars
+        email_search = EMAIL_RE.search
+        url_search = URL_RE.search
+        for s_val, s_count in zip(distinct_non_empty, distinct_counts.tolist()):
+            stripped = s_val.strip()
+            if stripped != s_val: lead_trail_count += s_count
+            # Both patterns need a literal '@' / '://'; the substring test skips the regex for most values
+            if '@' in s_val and email_search(s_val): emails_found += s_count
+            if '://' in s_val and url_search(s_val): urls_found += s_count
+            if check_case and "  " in stripped: multi_space_count += s_count
+            if check_non_printable and has_non_printable_chars(s_val):
+                non_printable_count += s_count
+
+        # Words: one lower(), one cleaning pass (hyphens are kept) and one split over the values joined,
+        # counted in C; stop words and pure numbers are then dropped from the distinct words only.
+        if len(distinct_non_empty) * 2 <= count_non_empty:
+            # Mostly repeated values: tokenize each distinct value once and weight its words by its count
+            word_counts = Counter(); clean_words = WORD_CLEAN_RE.sub
+            for s_val, s_count in zip(distinct_non_empty, distinct_counts.tolist()):
+                for word in clean_words('', s_val.lower()).split(): word_counts[word] += s_count
+        else:
+            word_counts = Counter(WORD_CLEAN_RE.sub('', "\n".join(non_empty_str_values).lower()).split())
+        for word in [w for w in word_counts if w in STOP_WORDS or w.isdigit()]: del word_counts[word]
+
+        if check_case and count_non_empty > 0:
+            # Case flags of the distinct values as boolean arrays (map() over the str methods iterates in C),
+            # weighted by the value counts. "Mixed" means none of isupper/islower/istitle;
+            # note a value like "I" counts as both upper and title.
+            distinct_count = len(distinct_non_empty)
+            is_upper = numpy.fromiter(map(str.isupper, distinct_non_empty), dtype=bool, count=distinct_count)
+            is_lower = numpy.fromiter(map(str.islower, distinct_non_empty), dtype=bool, count=distinct_count)
+            is_title = numpy.fromiter(map(str.istitle, distinct_non_empty), dtype=bool, count=distinct_count)
+            upper_count = int(distinct_counts[is_upper].sum()); lower_count = int(distinct_counts[is_lower].sum())
+            title_count = int(distinct_counts[is_title].sum())
+            mixed_count = count_non_empty - int(distinct_counts[is_upper | is_lower | is_title].sum())
+
+        if check_rarity_nonprintable:
             # Values occurring once should exclude empty strings from this specific count if desired
             # (currently includes empty string if it appears once)
-            results['Values Occurring Once'] = sum(1 for v_str,c in value_counts.items() if c == 1) 
-            results['Non-Printable Chars Count'] = sum(1 for s_val in str_values if self._has_non_printable_chars(s_val))
+            results['Values Occurring Once'] = countOf(value_counts.values(), 1)
+            results['Non-Printable Chars Count'] = non_printable_count
         else:
             results['Values Occurring Once'] = "N/A (Opt.)"
             results['Non-Printable Chars Count'] = "N/A (Opt.)"
 
-        if options.get('text_case_analysis', False):
+        if check_case:
             if count_non_empty > 0:
-                upper_count = sum(1 for s_val in non_empty_str_values if s_val.isupper())
-                lower_count = sum(1 for s_val in non_empty_str_values if s_val.islower())
-                title_count = sum(1 for s_val in non_empty_str_values if s_val.istitle())
-                
-                # Calculate mixed_count more accurately: non-empty strings that are not
-                # purely uppercase, not purely lowercase, and not purely titlecase.
-                mixed_count = 0
-                for s_val in non_empty_str_values:
-                    is_u = s_val.isupper()
-                    is_l = s_val.islower()
-                    is_t = s_val.istitle()
-                    # A string is "mixed" if it's not any single one of these exclusively.
-                    # However, a string like "I" is_upper and is_title.
-                    # Simplest for "Mixed Case" is: total_non_empty - (exclusive_upper + exclusive_lower + exclusive_title)
-                    # This requires identifying exclusive cases or defining mixed as "none of the above".
-                    # Current definition of % Mixed Case as 100 - sum_of_others is an approximation of "not one of the main categories".
-                    # Let's count strings that are *not* (isupper OR islower OR istitle)
-                    # This is still complex. Let's stick to the sum-based approach for now.
-                    # The sum of these % might exceed 100% if a string fits multiple (e.g. "I" is upper & title)
-                    # A clearer approach:
-                    # % Uppercase: s.isupper() and not s.islower() and not s.istitle() (unless it's trivial like "I")
-                    # This is too complex for summary stats. The current independent counts are fine.
-
-                results['% Uppercase'] = f"{(upper_count / count_non_empty * 100.0):.{dp}f}%"
-                results['% Lowercase'] = f"{(lower_count / count_non_empty * 100.0):.{dp}f}%"
-                results['% Titlecase'] = f"{(title_count / count_non_empty * 100.0):.{dp}f}%"
-                
-                # For % Mixed Case: count strings that are not fully upper, not fully lower, not fully title
-                # This is tricky due to overlaps (e.g. "A" is upper and title).
-                # A simple definition of mixed: if it has both upper and lower characters, and is not title.
-                # Or, more simply, items that don't fall into a clear category.
-                # The previous (100 - sum) is problematic if sum > 100.
-                # Count explicitly:
-                explicit_mixed_count = 0
-                for s in non_empty_str_values:
-                    if not s.isupper() and not s.islower() and not s.istitle():
-                        explicit_mixed_count +=1
-                results['% Mixed Case'] = f"{(explicit_mixed_count / count_non_empty * 100.0):.{dp}f}%"
-
-
-                results['Internal Multiple Spaces'] = sum(1 for s_val in non_empty_str_values if "  " in s_val.strip()) 
+                results['% Uppercase'] = pct(upper_count / count_non_empty * 100.0)
+                results['% Lowercase'] = pct(lower_count / count_non_empty * 100.0)
+                results['% Titlecase'] = pct(title_count / count_non_empty * 100.0)
+                results['% Mixed Case'] = pct(mixed_count / count_non_empty * 100.0)
+                results['Internal Multiple Spaces'] = multi_space_count
             else: 
-                na_percent = f"{0.0:.{dp}f}%"
-                results['% Uppercase'] = na_percent; results['% Lowercase'] = na_percent
-                results['% Titlecase'] = na_percent; results['% Mixed Case'] = na_percent
+                results['% Uppercase'] = zero_percent; results['% Lowercase'] = zero_percent
+                results['% Titlecase'] = zero_percent; results['% Mixed Case'] = zero_percent
                 results['Internal Multiple Spaces'] = 0
         else: 
             opt_na_msg = "N/A (Opt.)"
@@ -907,122 +1338,141 @@ class FieldProfilerDockWidget(QDockWidget):
             results['% Titlecase'] = opt_na_msg; results['% Mixed Case'] = opt_na_msg
             results['Internal Multiple Spaces'] = opt_na_msg
 
-
-        results['Leading/Trailing Spaces'] = sum(1 for s_val in non_empty_str_values if s_val != s_val.strip())
+        results['Leading/Trailing Spaces'] = lead_trail_count
         
-        word_list = []
-        for text in non_empty_str_values:
-            cleaned_text = text.lower(); cleaned_text = re.sub(r'[^\w\s-]', '', cleaned_text) # Keep hyphens in words
-            words = cleaned_text.split()
-            word_list.extend([word for word in words if word and word not in STOP_WORDS and not word.isdigit()])
-        if word_list:
-            word_counts = Counter(word_list)
+        if word_counts:
             top_words_list = [f"{word}:{count}" for word, count in word_counts.most_common(10)]
             results['Top Words'] = "\n".join(top_words_list) if top_words_list else "N/A"
         else: results['Top Words'] = "N/A (No words found)"
         
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        # More robust URL pattern allowing various TLDs and paths
-        url_pattern = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w._/?#%&@!=कोंडीत]*)*' 
-        emails_found = sum(1 for text in non_empty_str_values if re.search(email_pattern, text))
-        urls_found = sum(1 for text in non_empty_str_values if re.search(url_pattern, text))
         results['Pattern Matches'] = f"Emails: {emails_found}, URLs: {urls_found}"
         
         return results
 
+    @staticmethod
+    def _most_common_ints(int_values, limit):
+        # Counter.most_common() for a small-range integer array via bincount; ties go to the smaller value.
+        base = int(int_values.min())
+        counts = numpy.bincount(int_values - base)
+        top_indices = numpy.argsort(-counts, kind='stable')[:limit]
+        return [(int(i) + base, int(counts[i])) for i in top_indices if counts[i] > 0]
+
     def analyze_date_field_enhanced(self, original_variant_values, non_null_count, options):
-        results = OrderedDict()
+        results = {}
         dp = self.current_decimal_places 
+        pct = f"{{:.{dp}f}}%".format; zero_percent = pct(0.0) # Format spec parsed once per call
 
         if non_null_count == 0:
             results['Status'] = 'No date data'
             for key in self.STAT_KEYS_DATE:
                  if key not in ['Non-Null Count', 'Null Count', '% Null', 'Status']:
                     if key in ['Dates Before Today', 'Dates After Today']: results[key] = 0
-                    elif key.startswith('%') and ('Time' in key or 'Dates' in key): results[key] = f"{0.0:.{dp}f}%"
+                    elif key.startswith('%') and ('Time' in key or 'Dates' in key): results[key] = zero_percent
                     else: results[key] = 'N/A'
             return results
 
-        py_datetimes = []    
-        q_date_time_objects = [] # Store QDate or QDateTime objects for unique value counting
-        
-        # has_time_component_overall = False # Not strictly needed if we check instance type later
-
-        for v_orig in original_variant_values: 
-            if v_orig is None: continue 
-
-            py_dt = None
-            q_obj_for_unique = None # This will be QDate or QDateTime
-
-            if isinstance(v_orig, QDateTime) and v_orig.isValid():
-                py_dt = v_orig.toPyDateTime()
-                q_obj_for_unique = v_orig 
-                # has_time_component_overall = True
-            elif isinstance(v_orig, QDate) and v_orig.isValid():
-                # Convert QDate to Python datetime at midnight for consistent list type
-                py_dt = datetime(v_orig.year(), v_orig.month(), v_orig.day()) 
-                q_obj_for_unique = v_orig
-            elif isinstance(v_orig, str): # Attempt to parse string dates if necessary
-                # This part is tricky and depends on expected formats.
-                # For now, assume QGIS provides correct QVariant types.
-                # If string parsing is needed, it would go here with try-except blocks.
-                pass
-
-            if py_dt and q_obj_for_unique:
-                py_datetimes.append(py_dt)
-                q_date_time_objects.append(q_obj_for_unique)
+        q_datetimes_only = [] # Valid QDateTime and QDate objects split by type at collection time,
+        q_dates_only = []     # so later sections do not have to re-check isinstance per element
+        py_datetimes = [] # Python datetimes of q_datetimes_only, in the same order
+        date_julian_days = array.array('q') # Julian day numbers of q_dates_only; no Python datetime needed for a plain date
+        value_types = set(map(type, original_variant_values))
+
+        # A Date or DateTime column normally holds a single type: then validity and conversion are
+        # mapped over the whole list in C instead of dispatching per value in the loop below.
+        if value_types == {QDate} and all(map(QDate.isValid, original_variant_values)):
+            q_dates_only = list(original_variant_values)
+            date_julian_days = array.array('q', map(QDate.toJulianDay, q_dates_only))
+        elif value_types == {QDateTime} and all(map(QDateTime.isValid, original_variant_values)):
+            q_datetimes_only = list(original_variant_values)
+            py_datetimes = list(map(QDateTime.toPyDateTime, q_datetimes_only))
+        else:
+            # Bound methods hoisted out of the per-value loop
+            append_py_datetime = py_datetimes.append; append_julian_day = date_julian_days.append
+            append_q_datetime = q_datetimes_only.append; append_q_date = q_dates_only.append
+            
+            for v_orig in original_variant_values: 
+                if v_orig is None: continue 
+
+                if isinstance(v_orig, QDateTime) and v_orig.isValid():
+                    append_py_datetime(v_orig.toPyDateTime())
+                    append_q_datetime(v_orig)
+                elif isinstance(v_orig, QDate) and v_orig.isValid():
+                    append_julian_day(v_orig.toJulianDay())
+                    append_q_date(v_orig)
+                elif isinstance(v_orig, str): # Attempt to parse string dates if necessary
+                    # This part is tricky and depends on expected formats.
+                    # For now, assume QGIS provides correct QVariant types.
+                    # If string parsing is needed, it would go here with try-except blocks.
+                    pass
         
-        if not py_datetimes: 
+        if not q_datetimes_only and not q_dates_only: 
             results['Status'] = 'No valid date objects parsed'
             for key in self.STAT_KEYS_DATE: 
                  if key not in ['Non-Null Count', 'Null Count', '% Null', 'Status']:
                     if key in ['Dates Before Today', 'Dates After Today']: results[key] = 0
-                    elif key.startswith('%') and ('Time' in key or 'Dates' in key): results[key] = f"{0.0:.{dp}f}%"
+                    elif key.startswith('%') and ('Time' in key or 'Dates' in key): results[key] = zero_percent
                     else: results[key] = 'N/A'
             return results
 
-        min_d, max_d = min(py_datetimes), max(py_datetimes)
+        # Calendar components extracted with vectorized datetime64 casts instead of per-object attribute access.
+        # Datetimes come first, then dates at midnight (Julian day 2440588 is 1970-01-01).
+        # Datetimes become microseconds since the epoch through timedelta arithmetic mapped in C, which is
+        # several times faster than numpy parsing the datetime objects one by one.
+        datetime_micros = numpy.fromiter(map(floordiv, map(sub, py_datetimes, repeat(DATETIME64_EPOCH)), repeat(ONE_MICROSECOND)),
+                                         dtype=numpy.int64, count=len(py_datetimes))
+        dt64 = numpy.concatenate((datetime_micros.astype('datetime64[us]'),
+                                  (numpy.frombuffer(date_julian_days, dtype=numpy.int64) - 2440588).astype('datetime64[D]').astype('datetime64[us]')))
+
+        min_d, max_d = dt64.min().item(), dt64.max().item() # datetime.datetime
         # Format based on whether time is present in the original QDateTime objects
-        # This requires checking the original_variant_values or if any QDateTime was found
-        is_datetime_field = any(isinstance(q_obj, QDateTime) for q_obj in q_date_time_objects)
+        is_datetime_field = bool(q_datetimes_only)
 
         results['Min Date'] = min_d.isoformat(sep=' ', timespec='auto') if is_datetime_field else min_d.date().isoformat()
         results['Max Date'] = max_d.isoformat(sep=' ', timespec='auto') if is_datetime_field else max_d.date().isoformat()
 
-        years = [d.year for d in py_datetimes]
-        months = [d.month for d in py_datetimes] 
-        days_of_week_num = [d.weekday() for d in py_datetimes] # Monday is 0 and Sunday is 6
+        days_since_epoch = dt64.astype('datetime64[D]').astype(numpy.int64)
+        years = dt64.astype('datetime64[Y]').astype(numpy.int64) + 1970
+        months = dt64.astype('datetime64[M]').astype(numpy.int64) % 12 + 1
+        days_of_week_num = (days_since_epoch + 3) % 7 # 1970-01-01 was a Thursday; Monday is 0 and Sunday is 6
 
-        day_names_map = [self.tr("Mon"), self.tr("Tue"), self.tr("Wed"), self.tr("Thu"), self.tr("Fri"), self.tr("Sat"), self.tr("Sun")]
-        month_names_map = ["", self.tr("Jan"), self.tr("Feb"), self.tr("Mar"), self.tr("Apr"), 
-                           self.tr("May"), self.tr("Jun"), self.tr("Jul"), self.tr("Aug"), 
-                           self.tr("Sep"), self.tr("Oct"), self.tr("Nov"), self.tr("Dec")]
+        day_names_map = self.day_names
+        month_names_map = self.month_names
 
-
-        results['Common Years'] = ", ".join([f"{yr}:{cnt}" for yr, cnt in Counter(years).most_common(3)])
-        results['Common Months'] = ", ".join([f"{month_names_map[mo]}:{cnt}" for mo, cnt in Counter(months).most_common(3)])
-        results['Common Days'] = ", ".join([f"{day_names_map[d]}:{cnt}" for d, cnt in Counter(days_of_week_num).most_common(3)])
+        results['Common Years'] = ", ".join([f"{yr}:{cnt}" for yr, cnt in self._most_common_ints(years, 3)])
+        results['Common Months'] = ", ".join([f"{month_names_map[mo]}:{cnt}" for mo, cnt in self._most_common_ints(months, 3)])
+        results['Common Days'] = ", ".join([f"{day_names_map[d]}:{cnt}" for d, cnt in self._most_common_ints(days_of_week_num, 3)])
         
-        today_pydate = datetime.now().date() # Compare dates only for "Before/After Today"
-        results['Dates Before Today'] = sum(1 for d_py in py_datetimes if d_py.date() < today_pydate)
-        results['Dates After Today'] = sum(1 for d_py in py_datetimes if d_py.date() > today_pydate)
-
-        # Use the collected QDate/QDateTime objects for unique value counting
-        date_counts = Counter(q_date_time_objects) 
-        sorted_date_counts = sorted(date_counts.items(), key=lambda item: (-item[1], item[0])) 
-        top_unique_dates_list = []; actual_first_unique_date_for_selection = None
+        # Compare dates only for "Before/After Today", as day numbers on the datetime64 array
+        today_days = numpy.datetime64(datetime.now().date(), 'D').astype(numpy.int64)
+        results['Dates Before Today'] = int(numpy.count_nonzero(days_since_epoch < today_days))
+        results['Dates After Today'] = int(numpy.count_nonzero(days_since_epoch > today_days))
+
+        # Unique values counted on the datetime64 values instead of hashing every QDate/QDateTime;
+        # the object of a value's first occurrence stands for it (display and selection).
+        unique_keys, first_indices, unique_counts = numpy.unique(dt64.view(numpy.int64), return_index=True, return_counts=True)
         limit_unique = self.current_limit_unique_display
-        if sorted_date_counts:
-            actual_first_unique_date_for_selection = sorted_date_counts[0][0] # This is a QDate or QDateTime object
-            for i, (date_obj, count) in enumerate(sorted_date_counts):
-                if i >= limit_unique: break
-                
-                if isinstance(date_obj, QDateTime):
-                    display_val_preview = date_obj.toString(Qt.ISODateWithMs if date_obj.time().msec() > 0 else Qt.ISODate)
-                elif isinstance(date_obj, QDate):
+        # Only values counted at least as often as the limit-th largest count can be shown: select them with
+        # an O(n) partition, then sort just those. (-count, date) order: unique_keys are ascending, so a stable
+        # sort by count keeps dates ascending within ties.
+        candidates = numpy.arange(unique_counts.size)
+        if 0 < limit_unique < unique_counts.size:
+            kth = unique_counts.size - limit_unique
+            candidates = numpy.flatnonzero(unique_counts >= numpy.partition(unique_counts, kth)[kth])
+        top_order = candidates[numpy.argsort(-unique_counts[candidates], kind='stable')][:limit_unique]
+        q_objects_in_dt64_order = q_datetimes_only + q_dates_only
+        top_date_counts = [(q_objects_in_dt64_order[first_indices[i]], int(unique_counts[i])) for i in top_order]
+        top_unique_dates_list = []; actual_first_unique_date_for_selection = None
+        if top_date_counts:
+            actual_first_unique_date_for_selection = top_date_counts[0][0] # This is a QDate or QDateTime object
+            # The type follows from the position in dt64 (QDateTime values come first), so no isinstance per entry
+            datetime_count = len(q_datetimes_only)
+            # Milliseconds present <=> the microsecond key has a non-zero millisecond part; no time().msec() call per entry
+            has_msecs = (unique_keys[top_order] % 1000000 >= 1000).tolist()
+            for i, has_msec, (date_obj, count) in zip(top_order.tolist(), has_msecs, top_date_counts):
+                if first_indices[i] < datetime_count:
+                    display_val_preview = date_obj.toString(Qt.ISODateWithMs if has_msec else Qt.ISODate)
+                else:
                     display_val_preview = date_obj.toString(Qt.ISODate)
-                else: # Should not happen if collection is correct
-                    display_val_preview = str(date_obj)
 
                 top_unique_dates_list.append(f"'{display_val_preview}': {count}")
         results['Unique Values (Top)'] = "\n".join(top_unique_dates_list) if top_unique_dates_list else "N/A"
@@ -1030,43 +1480,32 @@ class FieldProfilerDockWidget(QDockWidget):
             results['Unique Values (Top)_actual_first_value'] = actual_first_unique_date_for_selection
 
 
-        if options.get('date_time_weekend', False) and q_date_time_objects:
-            midnight_count = 0
-            noon_count = 0
-            hours_list = []
-            
-            q_datetimes_only = [q_obj for q_obj in q_date_time_objects if isinstance(q_obj, QDateTime)]
-            
+        if options.get('date_time_weekend', False):
             if q_datetimes_only: 
-                for q_dt_obj in q_datetimes_only:
-                    time_obj = q_dt_obj.time()
-                    hours_list.append(time_obj.hour())
-                    if time_obj == QTime(0,0,0,0): midnight_count +=1
-                    if time_obj == QTime(12,0,0,0): noon_count +=1
+                # Time of day as integer milliseconds; midnight/noon/hour become array comparisons
+                datetimes_part = dt64[:len(q_datetimes_only)]
+                msecs_of_day = ((datetimes_part - datetimes_part.astype('datetime64[D]')) // numpy.timedelta64(1, 'ms')).astype(numpy.int32)
+                midnight_count = int(numpy.count_nonzero(msecs_of_day == 0))
+                noon_count = int(numpy.count_nonzero(msecs_of_day == 12 * 3600 * 1000))
+                hours = msecs_of_day // (3600 * 1000)
                 
-                results['Common Hours (Top 3)'] = ", ".join([f"{hr:02d}:00 ({cnt})" for hr, cnt in Counter(hours_list).most_common(3)]) if hours_list else "N/A"
-                results['% Midnight Time'] = f"{(midnight_count / len(q_datetimes_only) * 100.0):.{dp}f}%"
-                results['% Noon Time'] = f"{(noon_count / len(q_datetimes_only) * 100.0):.{dp}f}%"
+                results['Common Hours (Top 3)'] = ", ".join([f"{hr:02d}:00 ({cnt})" for hr, cnt in self._most_common_ints(hours, 3)])
+                results['% Midnight Time'] = pct(midnight_count / len(q_datetimes_only) * 100.0)
+                results['% Noon Time'] = pct(noon_count / len(q_datetimes_only) * 100.0)
             else: 
                 results['Common Hours (Top 3)'] = "N/A (No time data)"
-                results['% Midnight Time'] = f"{0.0:.{dp}f}%" # Or N/A if preferred
-                results['% Noon Time'] = f"{0.0:.{dp}f}%"
+                results['% Midnight Time'] = zero_percent # Or N/A if preferred
+                results['% Noon Time'] = zero_percent
             
-            all_q_dates_for_dow = []
-            for q_obj in q_date_time_objects: # Use original QDate/QDateTime objects
-                if isinstance(q_obj, QDateTime):
-                    all_q_dates_for_dow.append(q_obj.date()) # Get QDate part
-                elif isinstance(q_obj, QDate):
-                    all_q_dates_for_dow.append(q_obj)
+            # Reuse the weekday numbers computed from the epoch day count above (Monday = 0, ..., Sunday = 6)
+            total_for_dow_calc = len(days_of_week_num)
             
-            if all_q_dates_for_dow:
-                # QDate.dayOfWeek(): Monday = 1, ..., Sunday = 7
-                weekend_day_count = sum(1 for d_obj in all_q_dates_for_dow if d_obj.dayOfWeek() >= 6) # Saturday or Sunday
-                total_for_dow_calc = len(all_q_dates_for_dow)
-                results['% Weekend Dates'] = f"{(weekend_day_count / total_for_dow_calc * 100.0):.{dp}f}%"
-                results['% Weekday Dates'] = f"{((total_for_dow_calc - weekend_day_count) / total_for_dow_calc * 100.0):.{dp}f}%"
+            if total_for_dow_calc:
+                weekend_day_count = int(numpy.count_nonzero(days_of_week_num >= 5)) # Saturday or Sunday
+                results['% Weekend Dates'] = pct(weekend_day_count / total_for_dow_calc * 100.0)
+                results['% Weekday Dates'] = pct((total_for_dow_calc - weekend_day_count) / total_for_dow_calc * 100.0)
             else: 
-                 results['% Weekend Dates'] = f"{0.0:.{dp}f}%"; results['% Weekday Dates'] = f"{0.0:.{dp}f}%"
+                 results['% Weekend Dates'] = zero_percent; results['% Weekday Dates'] = zero_percent
         else: 
             opt_na_msg = "N/A (Opt.)"
             results['Common Hours (Top 3)'] = opt_na_msg; results['% Midnight Time'] = opt_na_msg; results['% Noon Time'] = opt_na_msg
@@ -1074,112 +1513,44 @@ class FieldProfilerDockWidget(QDockWidget):
             
         return results
 
-    def _on_cell_double_clicked(self, row, column):
+    def _on_cell_double_clicked(self, index):
+        row, column = index.row(), index.column()
         if column == 0: return # Clicked on the statistic name column itself
 
         current_layer = self.layerComboBox.currentLayer()
         if not current_layer or not isinstance(current_layer, QgsVectorLayer):
             self.iface.messageBar().pushMessage(self.tr("Selection Error"), self.tr("No valid layer selected."), level=Qgis.Warning); return
 
-        stat_name_item = self.resultsTableWidget.item(row, 0) # Item in the first column (statistic name)
-        field_header_item = self.resultsTableWidget.horizontalHeaderItem(column)
+        stat_name_index = self.resultsModel.index(row, 0) # Cell in the first column (statistic name)
+        field_header_text = self.resultsModel.headerData(column, Qt.Horizontal)
 
-        if not stat_name_item or not field_header_item:
+        if not stat_name_index.isValid() or not field_header_text:
             self.iface.messageBar().pushMessage(self.tr("Selection Error"), self.tr("Could not identify clicked cell data."), level=Qgis.Warning); return
 
-        # --- Get the original (English) statistic key stored in the item's UserRole data ---
-        original_statistic_key = stat_name_item.data(Qt.UserRole)
+        # --- Get the original (English) statistic key stored in the row's UserRole data ---
+        original_statistic_key = stat_name_index.data(Qt.UserRole)
         if not original_statistic_key:
             # This should ideally not happen if populate_results_table correctly sets UserRole
             self.iface.messageBar().pushMessage(self.tr("Selection Error"), self.tr("Internal error: Statistic key not found for the selected row."), level=Qgis.Critical)
             return
 
-        field_name_for_selection = field_header_item.text()
+        field_name_for_selection = field_header_text
         field_qobj = current_layer.fields().field(field_name_for_selection)
         if not field_qobj: 
             self.iface.messageBar().pushMessage(self.tr("Selection Error"), self.tr("Field '{0}' not found in layer.").format(field_name_for_selection), level=Qgis.Warning); return
 
 
         quoted_field_name = f'"{field_name_for_selection}"' # QGIS expression-friendly field name
-        expression = None
-        ids_to_select_directly = None
-
         is_string_field = (field_qobj.type() == QVariant.String)
         is_numeric_field = field_qobj.isNumeric()
         # is_date_field = field_qobj.type() in [QVariant.Date, QVariant.DateTime] # For future use if needed
 
-        # --- Logic based on the original_statistic_key ---
-        if original_statistic_key == 'Null Count':
-            expression = f"{quoted_field_name} IS NULL"
-        elif original_statistic_key == 'Empty Strings' and is_string_field:
-            expression = f"{quoted_field_name} = ''"
-        elif original_statistic_key == 'Leading/Trailing Spaces' and is_string_field:
-            # Select features where the original value is different from the trimmed value,
-            # and the trimmed value is not empty (to avoid selecting empty strings that are also "just spaces")
-            expression = f"{quoted_field_name} != trim({quoted_field_name}) AND length(trim({quoted_field_name})) > 0"
-        elif original_statistic_key == 'Conversion Errors' and is_numeric_field:
-            ids_to_select_directly = self.conversion_error_feature_ids_by_field.get(field_name_for_selection, [])
-            if not ids_to_select_directly: 
-                self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("No features with conversion errors were recorded for this field."), level=Qgis.Info); return
-        
-        elif original_statistic_key == 'Non-Printable Chars Count' and is_string_field:
-            ids_to_select_directly = self.non_printable_char_feature_ids_by_field.get(field_name_for_selection, [])
-            if not ids_to_select_directly: 
-                self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("No features with non-printable characters were recorded for this field."), level=Qgis.Info); return
-
-        elif original_statistic_key == 'Outliers (IQR)' and is_numeric_field:
-            field_stats = self.analysis_results_cache.get(field_name_for_selection, {})
-            q1_val = field_stats.get('Q1') 
-            q3_val = field_stats.get('Q3')
-            iqr_val = field_stats.get('IQR')
-            
-            # Check if all necessary values are valid numbers
-            if isinstance(q1_val, (int, float)) and isinstance(q3_val, (int, float)) and isinstance(iqr_val, (int, float)) and \
-               not (numpy.isnan(q1_val) or numpy.isnan(q3_val) or numpy.isnan(iqr_val)):
-                lower_bound = q1_val - 1.5 * iqr_val
-                upper_bound = q3_val + 1.5 * iqr_val
-                expression = f"({quoted_field_name} < {lower_bound} OR {quoted_field_name} > {upper_bound}) AND {quoted_field_name} IS NOT NULL"
-            else:
-                self.iface.messageBar().pushMessage(self.tr("Selection Info"), self.tr("Q1, Q3, or IQR is N/A or invalid for outlier selection. Cannot create expression."), level=Qgis.Info); return
-
-        elif original_statistic_key == 'Unique Values (Top)':
-            cached_field_results = self.analysis_results_cache.get(field_name_for_selection, {})
-            actual_first_value = cached_field_results.get('Unique Values (Top)_actual_first_value') # This is the raw value
+        # --- Logic based on the original_statistic_key: one dict lookup for the row's selection builder ---
+        handler_name = self.SELECTION_HANDLERS.get(original_statistic_key)
+        if handler_name is None: return # No action defined for this cell/statistic
+        expression, ids_to_select_directly = getattr(self, handler_name)(field_name_for_selection, quoted_field_name,
+                                                                         is_string_field, is_numeric_field)
 
-            # Check if the special key exists. If not, means no top unique value was determined or cached.
-            if 'Unique Values (Top)_actual_first_value' not in cached_field_results:
-                self.iface.messageBar().pushMessage(self.tr("Selection Info"), self.tr("No specific unique value cached for selection. This might happen if all values were NULL or the field was empty."), level=Qgis.Info); return
-            
-            # actual_first_value CAN be None (representing a NULL in the data that was frequent)
-            # or an empty string. These are valid for selection.
-            if actual_first_value is None:
-                 expression = f"{quoted_field_name} IS NULL" # Select NULLs if the top unique value was NULL
-            elif isinstance(actual_first_value, str):
-                escaped_val = actual_first_value.replace("'", "''") # Escape single quotes for SQL-like expression
-                expression = f"{quoted_field_name} = '{escaped_val}'"
-            elif isinstance(actual_first_value, (int, float, numpy.number)): 
-                if numpy.isnan(actual_first_value): 
-                    # Selecting NaN by direct equality in QGIS expressions is tricky.
-                    # It's better to inform the user or select NULLs if NaN implies missing.
-                    # For now, let's prevent selection of explicit NaNs this way.
-                    self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("Cannot select NaN (Not a Number) unique value directly by this expression method. Consider selecting NULLs if appropriate."), level=Qgis.Info); return
-                expression = f"{quoted_field_name} = {float(actual_first_value)}" # Ensure it's a Python float
-            elif isinstance(actual_first_value, QDate):
-                # QGIS expression functions for date/datetime: date('YYYY-MM-DD'), datetime('YYYY-MM-DD HH:MM:SS')
-                expression = f"{quoted_field_name} = date('{actual_first_value.toString(Qt.ISODate)}')"
-            elif isinstance(actual_first_value, QDateTime):
-                # For QDateTime, QGIS expressions expect ISO format, potentially with time.
-                # Qt.ISODate produces YYYY-MM-DDTHH:MM:SS
-                # QGIS datetime() function usually takes 'YYYY-MM-DD HH:MM:SS.mmmZ'
-                # Let's try with Qt.ISODate and see if QGIS handles it. Otherwise, more formatting needed.
-                iso_string = actual_first_value.toString(Qt.ISODate) # e.g., "2023-10-26T10:30:00"
-                # QGIS might prefer space separator for datetime()
-                # expression_dt_string = actual_first_value.toString("yyyy-MM-dd HH:mm:ss.zzz") # More QGIS friendly
-                expression = f"{quoted_field_name} = datetime('{iso_string}')"
-
-            else:
-                self.iface.messageBar().pushMessage(self.tr("Warning"), self.tr("Cannot select unique value of type: {0}. Selection for this type is not implemented.").format(type(actual_first_value).__name__), level=Qgis.Warning); return
-        
         if expression:
             self._select_features_by_expression(current_layer, field_name_for_selection, expression)
         elif ids_to_select_directly is not None: # Check for not None, as empty list is valid
@@ -1187,6 +1558,87 @@ class FieldProfilerDockWidget(QDockWidget):
         # else: no action defined for this cell/statistic
 
 
+    # Statistic key -> method building (expression, feature ids) to select for a double-clicked cell of that row;
+    # a method returns (None, None) when nothing should be selected (after telling the user why, if needed).
+    SELECTION_HANDLERS = {
+        'Null Count': '_null_count_selection',
+        'Empty Strings': '_empty_strings_selection',
+        'Leading/Trailing Spaces': '_leading_trailing_spaces_selection',
+        'Conversion Errors': '_conversion_errors_selection',
+        'Non-Printable Chars Count': '_non_printable_selection',
+        'Outliers (IQR)': '_outliers_selection',
+        'Unique Values (Top)': '_top_unique_value_selection',
+    }
+
+    def _null_count_selection(self, field_name, quoted_field_name, is_string_field, is_numeric_field):
+        return f"{quoted_field_name} IS NULL", None
+
+    def _empty_strings_selection(self, field_name, quoted_field_name, is_string_field, is_numeric_field):
+        if not is_string_field: return None, None
+        return f"{quoted_field_name} = ''", None
+
+    def _leading_trailing_spaces_selection(self, field_name, quoted_field_name, is_string_field, is_numeric_field):
+        if not is_string_field: return None, None
+        # Select features where the original value is different from the trimmed value,
+        # and the trimmed value is not empty (to avoid selecting empty strings that are also "just spaces")
+        return f"{quoted_field_name} != trim({quoted_field_name}) AND length(trim({quoted_field_name})) > 0", None
+
+    def _conversion_errors_selection(self, field_name, quoted_field_name, is_string_field, is_numeric_field):
+        if not is_numeric_field: return None, None
+        ids_to_select_directly = self.conversion_error_feature_ids_by_field.get(field_name, [])
+        if not ids_to_select_directly: 
+            self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("No features with conversion errors were recorded for this field."), level=Qgis.Info); return None, None
+        return None, ids_to_select_directly
+
+    def _non_printable_selection(self, field_name, quoted_field_name, is_string_field, is_numeric_field):
+        if not is_string_field: return None, None
+        ids_to_select_directly = self.non_printable_char_feature_ids_by_field.get(field_name, [])
+        if not ids_to_select_directly: 
+            self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("No features with non-printable characters were recorded for this field."), level=Qgis.Info); return None, None
+        return None, ids_to_select_directly
+
+    def _outliers_selection(self, field_name, quoted_field_name, is_string_field, is_numeric_field):
+        if not is_numeric_field: return None, None
+        field_stats = self.analysis_results_cache.get(field_name, {})
+        quartile_stats = (field_stats.get('Q1'), field_stats.get('Q3'), field_stats.get('IQR'))
+        q1_val, q3_val, iqr_val = quartile_stats
+        
+        # Check if all necessary values are valid numbers: type first, then one finiteness check for all three
+        if all(isinstance(v, (int, float)) for v in quartile_stats) and numpy.isfinite(quartile_stats).all():
+            lower_bound = q1_val - 1.5 * iqr_val
+            upper_bound = q3_val + 1.5 * iqr_val
+            return f"({quoted_field_name} < {lower_bound} OR {quoted_field_name} > {upper_bound}) AND {quoted_field_name} IS NOT NULL", None
+        self.iface.messageBar().pushMessage(self.tr("Selection Info"), self.tr("Q1, Q3, or IQR is N/A or invalid for outlier selection. Cannot create expression."), level=Qgis.Info)
+        return None, None
+
+    def _top_unique_value_selection(self, field_name, quoted_field_name, is_string_field, is_numeric_field):
+        cached_field_results = self.analysis_results_cache.get(field_name, {})
+        actual_first_value = cached_field_results.get('Unique Values (Top)_actual_first_value') # This is the raw value
+
+        # Check if the special key exists. If not, means no top unique value was determined or cached.
+        if 'Unique Values (Top)_actual_first_value' not in cached_field_results:
+            self.iface.messageBar().pushMessage(self.tr("Selection Info"), self.tr("No specific unique value cached for selection. This might happen if all values were NULL or the field was empty."), level=Qgis.Info); return None, None
+        
+        # actual_first_value CAN be None (representing a NULL in the data that was frequent)
+        # or an empty string. These are valid for selection.
+        if isinstance(actual_first_value, (int, float, numpy.number)): 
+            if numpy.isnan(actual_first_value): 
+                # Selecting NaN by direct equality in QGIS expressions is tricky.
+                # It's better to inform the user or select NULLs if NaN implies missing.
+                # For now, let's prevent selection of explicit NaNs this way.
+                self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("Cannot select NaN (Not a Number) unique value directly by this expression method. Consider selecting NULLs if appropriate."), level=Qgis.Info); return None, None
+            actual_first_value = float(actual_first_value) # Plain Python float for the QVariant conversion
+        elif isinstance(actual_first_value, QDate):
+            # QGIS expression functions for date/datetime: date('YYYY-MM-DD'), datetime('YYYY-MM-DDTHH:MM:SS')
+            return f"{quoted_field_name} = date('{actual_first_value.toString(Qt.ISODate)}')", None
+        elif isinstance(actual_first_value, QDateTime):
+            return f"{quoted_field_name} = datetime('{actual_first_value.toString(Qt.ISODate)}')", None
+        elif not (actual_first_value is None or isinstance(actual_first_value, str)):
+            self.iface.messageBar().pushMessage(self.tr("Warning"), self.tr("Cannot select unique value of type: {0}. Selection for this type is not implemented.").format(type(actual_first_value).__name__), level=Qgis.Warning); return None, None
+        # QGIS quotes the field name and the value itself (NULL becomes IS NULL)
+        expression = QgsExpression.createFieldEqualityExpression(field_name, actual_first_value)
+        return expression, None
+
     def _select_features_by_expression(self, layer, field_name, expression_string):
         try:
             selection_mode = QgsVectorLayer.SetSelection
@@ -1201,10 +1653,9 @@ class FieldProfilerDockWidget(QDockWidget):
             self.iface.mapCanvas().refresh() # Refresh map
             # Try to make the attribute table update if open and layer matches
             if self.iface.attributesToolBar() and self.iface.attributesToolBar().isVisible():
-                for table_view in self.iface.mainWindow().findChildren(QgsAttributeTable): # QgsAttributeTable may not be directly accessible
-                    if table_view.layer() == layer:
-                        table_view.doSelect(layer.selectedFeatureIds()) # This is a guess, API might differ
-                        break
+                table_view = self._find_attr_table(layer) # QgsAttributeTable may not be directly accessible
+                if table_view is not None:
+                    table_view.doSelect(layer.selectedFeatureIds()) # This is a guess, API might differ
             
             if hasattr(self.iface, 'actionOpenTable') and self.iface.actionOpenTable().isEnabled():
                 # This is a generic way to try and get attention to selection
@@ -1221,6 +1672,22 @@ class FieldProfilerDockWidget(QDockWidget):
         except Exception as e:
             self.iface.messageBar().pushMessage(self.tr("Selection Error"), self.tr("Error selecting features by expression: {0}\nExpression: {1}").format(str(e), expression_string), level=Qgis.Critical)
 
+    def _find_attr_table(self, layer):
+        # Reuse the attribute table found for this layer last time while it is still alive and visible;
+        # otherwise walk the main window's widget tree once and remember the match.
+        table_view = self._attr_table_cache.get(layer.id())
+        if table_view is not None:
+            try:
+                if table_view.isVisible() and table_view.layer() == layer: return table_view
+            except RuntimeError: # Underlying C++ widget was deleted
+                pass
+            del self._attr_table_cache[layer.id()]
+        for table_view in self.iface.mainWindow().findChildren(QgsAttributeTable):
+            if table_view.layer() == layer:
+                self._attr_table_cache[layer.id()] = table_view
+                return table_view
+        return None
+
     def _select_features_by_ids(self, layer, field_name, fids_to_select):
         try:
             num_selected = 0
@@ -1233,24 +1700,25 @@ class FieldProfilerDockWidget(QDockWidget):
 
             if self._was_analyzing_selected_features:
                 # Intersect the provided FIDs with the current selection on the layer
-                current_selection_on_layer = set(layer.selectedFeatureIds())
-                ids_to_actually_select = [fid for fid in final_ids_for_selection if fid in current_selection_on_layer]
+                # Vectorized membership test on int64 arrays; keeps the order of the provided FIDs
+                current_selection_on_layer = numpy.fromiter(layer.selectedFeatureIds(), dtype=numpy.int64)
+                fids_np = numpy.fromiter(final_ids_for_selection, dtype=numpy.int64, count=len(final_ids_for_selection))
+                ids_to_actually_select = fids_np[numpy.isin(fids_np, current_selection_on_layer)].tolist()
                 
-                layer.selectByIds(ids_to_actually_select, QgsVectorLayer.SetSelection) # Replace current selection with the intersection
-                num_selected = len(ids_to_actually_select)
+                selected_ids = ids_to_actually_select # Replace current selection with the intersection
                 msg_suffix = self.tr(" (Intersected with current layer selection).")
             else:
-                layer.selectByIds(final_ids_for_selection, QgsVectorLayer.SetSelection) # Set new selection
-                num_selected = len(final_ids_for_selection)
+                selected_ids = final_ids_for_selection # Set new selection
                 msg_suffix = "."
+            layer.selectByIds(selected_ids, QgsVectorLayer.SetSelection)
+            num_selected = len(selected_ids)
             
             self.iface.mapCanvas().refresh()
             # Similar attribute table update attempt as in _select_features_by_expression
             if self.iface.attributesToolBar() and self.iface.attributesToolBar().isVisible():
-                 for table_view in self.iface.mainWindow().findChildren(QgsAttributeTable):
-                    if table_view.layer() == layer:
-                        table_view.doSelect(layer.selectedFeatureIds())
-                        break
+                 table_view = self._find_attr_table(layer)
+                 if table_view is not None:
+                    table_view.doSelect(selected_ids) # Exactly the ids just selected; no second selectedFeatureIds() copy
             
             msg = self.tr("Selected {0} features for field '{1}' based on stored IDs{2}").format(num_selected, field_name, msg_suffix)
             self.iface.messageBar().pushMessage(self.tr("Selection Succeeded"), msg, level=Qgis.Success, duration=7)
@@ -1258,35 +1726,24 @@ class FieldProfilerDockWidget(QDockWidget):
             self.iface.messageBar().pushMessage(self.tr("Selection Error"), self.tr("Error selecting features by IDs: {0}").format(str(e)), level=Qgis.Critical)
 
     def copy_results_to_clipboard(self):
-        if self.resultsTableWidget.rowCount() == 0 or self.resultsTableWidget.columnCount() == 0:
+        if self.resultsModel.rowCount() == 0 or self.resultsModel.columnCount() == 0:
             self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("No results to copy."), level=Qgis.Info); return
         clipboard = QApplication.clipboard()
         if not clipboard:
             self.iface.messageBar().pushMessage(self.tr("Error"), self.tr("Could not access clipboard."), level=Qgis.Critical); return
-        output = ""
-        # Headers
-        headers = [self.resultsTableWidget.horizontalHeaderItem(c).text() for c in range(self.resultsTableWidget.columnCount())]
-        output += "\t".join(headers) + "\n"
-        # Data rows
-        for r in range(self.resultsTableWidget.rowCount()):
-            row_data = [];
-            for c in range(self.resultsTableWidget.columnCount()):
-                 item = self.resultsTableWidget.item(r, c)
-                 # Replace newlines in cell text to keep CSV/TSV structure clean
-                 cell_text = item.text().replace("\n", " | ") if item else ""
-                 row_data.append(cell_text)
-            output += "\t".join(row_data) + "\n"
+        # Headers and data rows as shown in the table (newlines replaced)
+        output = "".join("\t".join(row) + "\n" for row in self.resultsModel.text_grid())
         clipboard.setText(output)
         self.iface.messageBar().pushMessage(self.tr("Success"), self.tr("Table results copied to clipboard."), level=Qgis.Success)
 
     def export_results_to_csv(self):
-        if self.resultsTableWidget.rowCount() == 0 or self.resultsTableWidget.columnCount() == 0:
+        if self.resultsModel.rowCount() == 0 or self.resultsModel.columnCount() == 0:
             self.iface.messageBar().pushMessage(self.tr("Info"), self.tr("No results to export."), level=Qgis.Info); return
         
         default_filename = "field_profiler_results.csv"
         current_qgs_layer = self.layerComboBox.currentLayer()
         if current_qgs_layer: 
-            layer_name_sanitized = re.sub(r'[^\w\.-]', '_', current_qgs_layer.name()) # Sanitize layer name
+            layer_name_sanitized = UNSAFE_FILENAME_CHARS_RE.sub('_', current_qgs_layer.name()) # Sanitize layer name
             default_filename = f"{layer_name_sanitized}_profile.csv"
             
         file_path, _ = QFileDialog.getSaveFileName(self, self.tr("Export Results to CSV"), default_filename, self.tr("CSV Files (*.csv);;All Files (*)"))
@@ -1294,20 +1751,11 @@ class FieldProfilerDockWidget(QDockWidget):
         if not file_path: return # User cancelled
         
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile: # utf-8-sig for Excel compatibility with BOM
+            # utf-8-sig for Excel compatibility with BOM; a 1 MiB buffer writes typical result tables in one go
+            with open(file_path, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
-                # Headers
-                headers = [self.resultsTableWidget.horizontalHeaderItem(c).text() for c in range(self.resultsTableWidget.columnCount())]
-                writer.writerow(headers)
-                # Data rows
-                for r in range(self.resultsTableWidget.rowCount()):
-                    row_data = [];
-                    for c in range(self.resultsTableWidget.columnCount()):
-                        item = self.resultsTableWidget.item(r, c)
-                        # Replace newlines in cell text to keep CSV structure clean
-                        cell_text = item.text().replace("\n", " | ") if item else ""
-                        row_data.append(cell_text)
-                    writer.writerow(row_data)
+                # Headers and data rows as shown in the table (newlines replaced)
+                writer.writerows(self.resultsModel.text_grid())
             self.iface.messageBar().pushMessage(self.tr("Success"), self.tr("Results successfully exported to CSV: {0}").format(file_path), level=Qgis.Success)
         except Exception as e: 
             self.iface.messageBar().pushMessage(self.tr("Error"), self.tr("Could not export results to CSV: ") + str(e), level=Qgis.Critical)